@@ -300,13 +300,71 @@ if __name__ == "__main__":
 # |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
 # |___________________________________________________________________________|
 
-import pandas as pd
+import hashlib
 import os
+import pickle
 import re
+import time
+
+from cascade import CascadePolicy, CascadeStats
+from matcher import PhraseMatcher
+
+# Config: (Filename, Text Column, Label Column)
+FILES_CONFIG = [
+    ("hinglish.csv", "text", "hate_label"), 
+    ("english.csv", "tweet", "class"),
+    ("hindi.csv", "text", "label")
+]
+
+# Compiled lexicon (phrase split + prebuilt matchers), see lexicon_key()
+LEXICON_ARTIFACT = os.path.join("engine", "lexicon.pkl")
+LEXICON_FORMAT = 1
+
+# Batch normalization helpers (see HybridAnalyzer.normalize_batch)
+_SEPARATOR = "\x00"
+_REPEATS = re.compile(r'([^\x00\n])\1+')
+
+
+def lexicon_key(loose_phrases, raw_path="raw_data"):
+    """
+    Content hash of everything the compiled lexicon depends on:
+    the artifact format, the hardcoded loose list and every source CSV.
+    """
+    h = hashlib.sha256(f"format={LEXICON_FORMAT}\n".encode())
+    h.update("\n".join(sorted(loose_phrases)).encode())
+    for filename, text_col, label_col in FILES_CONFIG:
+        h.update(f"\n{filename}:{text_col}:{label_col}:".encode())
+        path = os.path.join(raw_path, filename)
+        if not os.path.exists(path):
+            h.update(b"missing")
+            continue
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(1 << 20), b""):
+                h.update(block)
+    return h.hexdigest()
+
+
+class _KeepTable(dict):
+    """str.translate table equal to re.sub(r'[^a-zA-Z\\s]', '', ...), filled lazily."""
+
+    def __missing__(self, cp):
+        ch = chr(cp)
+        keep = ch == _SEPARATOR or ch.isspace() or (ch.isascii() and ch.isalpha())
+        self[cp] = cp if keep else None
+        return self[cp]
+
+
+_LETTERS_AND_SPACES = _KeepTable()
+
 
 class HybridAnalyzer:
-    def __init__(self):
+    def __init__(self, ml_model_path=None, policy=None):
         print("🛡️ Initializing Forensic Engine...")
+
+        # Bumped whenever a phrase set is assigned or add_phrases() runs; the
+        # compiled matchers are rebuilt once it moves past the compiled revision
+        self.phrases_revision = 0
+        self._compiled_revision = None
         
         # 1. Master Set (Everything combined)
         self.toxic_phrases = set()
@@ -324,25 +382,49 @@ class HybridAnalyzer:
         # These need word boundaries (e.g. detect "kill" but ignore "skill")
         self.strict_phrases = set()
         
+        # 4. OPTIONAL ML TIER: DistilBERT scores what the lexicon missed
+        # The cascade policy decides which comments reach it (see cascade.py)
+        self.ml_scorer = None
+        self.ml_model_path = None
+        self.policy = policy or CascadePolicy()
+        self.stats = CascadeStats()
+
         # Initialize
         self.toxic_phrases.update(self.loose_phrases)
         self.load_database()
+        if ml_model_path:
+            self.enable_ml(ml_model_path)
 
     def load_database(self):
-        """Loads external CSVs and sorts words into Strict or Loose categories"""
-        # Config: (Filename, Text Column, Label Column)
-        files_config = [
-            ("hinglish.csv", "text", "hate_label"), 
-            ("english.csv", "tweet", "class"),
-            ("hindi.csv", "text", "label")
-        ]
-        
+        """Loads the compiled lexicon, recompiling it from the CSVs only if a source changed"""
         raw_path = "raw_data"
         if not os.path.exists(raw_path):
             print(f"⚠️ Warning: '{raw_path}' folder not found. Using hardcoded list.")
             # We continue anyway because we have the hardcoded list!
 
-        for filename, text_col, label_col in files_config:
+        key = lexicon_key(self.loose_phrases, raw_path)
+        self.lexicon_key = key
+        if self.load_artifact(key):
+            print(f"✅ Database Ready: {len(self.toxic_phrases)} active patterns (cached).")
+            return
+
+        self.read_csv_sources(raw_path)
+
+        # Build the matching engine once, instead of on every scan
+        self.compile_patterns()
+        self.save_artifact(key)
+
+        print(f"✅ Database Ready: {len(self.toxic_phrases)} active patterns.")
+
+    def read_csv_sources(self, raw_path="raw_data"):
+        """Loads external CSVs and sorts words into Strict or Loose categories"""
+        # Imported here so the cached-artifact path never pays for pandas
+        import pandas as pd
+
+        # Substring probe for the loose list (one pass per phrase instead of a loop)
+        loose_probe = PhraseMatcher(self.loose_phrases)
+
+        for filename, text_col, label_col in FILES_CONFIG:
             path = os.path.join(raw_path, filename)
             if os.path.exists(path):
                 try:
@@ -361,13 +443,131 @@ class HybridAnalyzer:
 
                             # Logic: If it matches our known Hinglish list, keep it loose.
                             # Otherwise, treat it as Strict English to prevent false positives.
-                            if any(risk in p for risk in self.loose_phrases):
+                            if loose_probe.search(p):
                                 continue 
                             else:
                                 self.strict_phrases.add(p)
                 except: pass
-        
-        print(f"✅ Database Ready: {len(self.toxic_phrases)} active patterns.")
+
+    def load_artifact(self, key, path=None):
+        """Restores phrase sets and prebuilt matchers from the compiled artifact"""
+        path = path or LEXICON_ARTIFACT
+        if not os.path.exists(path):
+            return False
+        try:
+            with open(path, "rb") as f:
+                data = pickle.load(f)
+            if data.get("key") != key:
+                return False
+            self.toxic_phrases = data["toxic_phrases"]
+            self.loose_phrases = data["loose_phrases"]
+            self.strict_phrases = data["strict_phrases"]
+            self.loose_matcher = data["loose_matcher"]
+            self.strict_matcher = data["strict_matcher"]
+            self._compiled_revision = self.phrases_revision
+            return True
+        except Exception as e:
+            print(f"⚠️ Lexicon artifact unreadable, recompiling: {e}")
+            return False
+
+    def save_artifact(self, key, path=None):
+        """Writes the compiled lexicon next to the model (best effort, atomic replace)"""
+        path = path or LEXICON_ARTIFACT
+        data = {
+            "key": key,
+            "toxic_phrases": self.toxic_phrases,
+            "loose_phrases": self.loose_phrases,
+            "strict_phrases": self.strict_phrases,
+            "loose_matcher": self.loose_matcher,
+            "strict_matcher": self.strict_matcher,
+        }
+        try:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            tmp = f"{path}.{os.getpid()}.tmp"
+            with open(tmp, "wb") as f:
+                pickle.dump(data, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp, path)
+        except Exception as e:
+            print(f"⚠️ Could not save lexicon artifact: {e}")
+
+    def enable_ml(self, model_path=None, **kwargs):
+        """Loads engine/model_v1 (or model_path) as the second tier behind the lexicon"""
+        from ml_scorer import MODEL_PATH, TransformerScorer
+        self.ml_scorer = TransformerScorer(model_path or MODEL_PATH, **kwargs)
+        self.ml_model_path = model_path or MODEL_PATH
+
+    def version(self):
+        """
+        Fingerprint of everything that decides a verdict: lexicon sources, phrases
+        added at runtime, the ML model and the cascade policy. Scan checkpoints
+        made under another version are not trusted.
+        """
+        h = hashlib.sha256(self.lexicon_key.encode())
+        h.update(f"\nphrases={self.phrase_digest()}".encode())
+        if self.ml_scorer is not None:
+            h.update(f"\nml={self.ml_model_path}:{self.ml_scorer.backend}".encode())
+            h.update(f"\npolicy={self.policy.mode}:{self.policy.ml_threshold}:{self.policy.obfuscation_threshold}:"
+                     f"{self.policy.min_length}".encode())
+        return h.hexdigest()[:16]
+
+    def phrase_digest(self):
+        """
+        Hash of the phrase contents. Computed from the sets on every call (well
+        under a millisecond for the shipped lexicon), so no in-place edit or set
+        swap can leave it stale.
+        """
+        h = hashlib.sha256()
+        for phrases in (self.loose_phrases, self.strict_phrases):
+            h.update("\n".join(sorted(phrases)).encode())
+            h.update(b"\0")
+        return h.hexdigest()
+
+    def compile_patterns(self):
+        """
+        Builds the loose/strict matchers from the current phrase sets.
+        Phrases are ordered longest-first, so the reported match is deterministic.
+        """
+        self.loose_matcher = PhraseMatcher(self.loose_phrases)
+        self.strict_matcher = PhraseMatcher(self.strict_phrases, word_boundary=True)
+        self._compiled_revision = self.phrases_revision
+
+    @property
+    def loose_phrases(self):
+        return self._loose_phrases
+
+    @loose_phrases.setter
+    def loose_phrases(self, phrases):
+        self._loose_phrases = phrases
+        self.phrases_revision += 1
+
+    @property
+    def strict_phrases(self):
+        return self._strict_phrases
+
+    @strict_phrases.setter
+    def strict_phrases(self, phrases):
+        self._strict_phrases = phrases
+        self.phrases_revision += 1
+
+    def add_phrases(self, phrases, loose=False):
+        """
+        Adds phrases at runtime. The matchers are rebuilt on the next scan.
+        Change the lexicon through here or by assigning a new set; the sets
+        themselves are plain and do not report in-place edits.
+        """
+        target = self.loose_phrases if loose else self.strict_phrases
+        for p in phrases:
+            p = str(p).lower().strip()
+            if len(p) < 2: continue
+            target.add(p)
+            self.toxic_phrases.add(p)
+        self.phrases_revision += 1
+
+    def get_matchers(self):
+        """Returns the compiled matchers, rebuilding them only if the phrases changed since."""
+        if self._compiled_revision != self.phrases_revision:
+            self.compile_patterns()
+        return self.loose_matcher, self.strict_matcher
 
     def normalize_text(self, text):
         """
@@ -383,40 +583,119 @@ class HybridAnalyzer:
         
         return text
 
+    def normalize_batch(self, texts):
+        """
+        normalize_text() for a whole list at once.
+        The batch is joined with a NUL separator, stripped with one str.translate
+        call and collapsed with one regex pass, then split back.
+        """
+        if not texts: return []
+        joined = _SEPARATOR.join(texts)
+        if joined.count(_SEPARATOR) != len(texts) - 1:
+            # A comment contains the separator itself, fall back to one-by-one
+            return [self.normalize_text(t) for t in texts]
+        joined = joined.translate(_LETTERS_AND_SPACES)
+        joined = _REPEATS.sub(r'\1', joined)
+        return joined.split(_SEPARATOR)
+
     def scan(self, text):
         if not text: return {"is_toxic": False, "reason": "Safe", "score": 0.0}
+        if self.ml_scorer: return self._scan_batch([text])[0]
+
+        start = time.perf_counter()
 
         # 1. Prepare Variations
         raw_clean = text.lower().strip()
         normalized = self.normalize_text(raw_clean)
         
+        res = self.match_variants(raw_clean, normalized)
+        self.stats.record("lexicon", 1, time.perf_counter() - start, res["is_toxic"])
+        return res
+
+    def scan_many(self, texts, batch_size=4096):
+        """
+        Scans a list or iterator of comments, returns results in the same order.
+        Normalization runs once per batch instead of once per comment.
+        """
+        return list(self.iter_scan(texts, batch_size))
+
+    def iter_scan(self, texts, batch_size=4096):
+        """Generator version of scan_many(). Memory stays bounded by batch_size."""
+        batch = []
+        for text in texts:
+            batch.append(text)
+            if len(batch) >= batch_size:
+                yield from self._scan_batch(batch)
+                batch = []
+        if batch:
+            yield from self._scan_batch(batch)
+
+    def _scan_batch(self, texts):
+        # --- TIER 1: LEXICON (cheap, every comment) ---
+        start = time.perf_counter()
+        raw = [t.lower().strip() if t else "" for t in texts]
+        normalized = self.normalize_batch(raw)
+        results = [
+            self.match_variants(r, n) if r else {"is_toxic": False, "reason": "Safe", "score": 0.0}
+            for r, n in zip(raw, normalized)
+        ]
+        self.stats.record("lexicon", len(results), time.perf_counter() - start, sum(r["is_toxic"] for r in results))
+
+        # --- TIER 2: ML (only what the cascade policy routes to it) ---
+        if self.ml_scorer:
+            routed = [i for i, res in enumerate(results) if self.policy.wants_ml(res, raw[i], normalized[i])]
+            self.apply_ml(texts, results, routed)
+        return results
+
+    def apply_ml(self, texts, results, indices):
+        """
+        Scores results[indices] in micro-batches and adds "ml_score" to them.
+        Lexicon misses above the policy's ml_threshold are flagged.
+        """
+        if not indices: return
+        start = time.perf_counter()
+        probs = self.ml_scorer.score_many([texts[i] for i in indices])
+        hits = 0
+        for i, prob in zip(indices, probs):
+            res = results[i]
+            res["ml_score"] = round(prob, 3)
+            if not res["is_toxic"] and prob > self.policy.ml_threshold:
+                hits += 1
+                res.update({
+                    "is_toxic": True,
+                    "reason": f"ML Classifier: {prob:.0%} toxic",
+                    "score": round(prob, 3)
+                })
+        self.stats.record("ml", len(indices), time.perf_counter() - start, hits)
+
+    def match_variants(self, raw_clean, normalized):
+        """Runs the loose and strict phases over an already-prepared comment."""
         # We check both the original and the normalized version
         variants = [raw_clean, normalized]
+        loose_matcher, strict_matcher = self.get_matchers()
 
         # --- PHASE 1: HIGH RISK (Hinglish) CHECK ---
-        # This uses "Substring Matching".
+        # This uses "Substring Matching" (one Aho-Corasick pass per variant).
         # It finds "chutiya" inside "aaachutiyaaa" or "yehchutiyahai"
         for v in variants:
-            for phrase in self.loose_phrases:
-                if phrase in v:
-                    return {
-                        "is_toxic": True, 
-                        "reason": f"Direct Match (High Risk): '{phrase}'", 
-                        "score": 1.0
-                    }
+            phrase = loose_matcher.search(v)
+            if phrase:
+                return {
+                    "is_toxic": True, 
+                    "reason": f"Direct Match (High Risk): '{phrase}'", 
+                    "score": 1.0
+                }
 
         # --- PHASE 2: STRICT (English) CHECK ---
-        # This uses "Word Boundaries" (\b).
+        # Same automaton, but hits must sit on word boundaries (like \b).
         # It finds "kill" but ignores "skill".
-        if self.strict_phrases:
-            pattern_str = r'\b(' + '|'.join(re.escape(p) for p in self.strict_phrases) + r')\b'
-            for v in variants:
-                match = re.search(pattern_str, v)
-                if match:
-                    return {
-                        "is_toxic": True, 
-                        "reason": f"Exact Match: '{match.group(0)}'", 
-                        "score": 1.0
-                    }
+        for v in variants:
+            phrase = strict_matcher.search(v)
+            if phrase:
+                return {
+                    "is_toxic": True, 
+                    "reason": f"Exact Match: '{phrase}'", 
+                    "score": 1.0
+                }
 
         return {"is_toxic": False, "reason": "Safe", "score": 0.0}
\ No newline at end of file
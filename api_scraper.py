@@ -0,0 +1,122 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (API Scraper)                             |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+
+from datetime import datetime, timezone
+
+from scraper import EnterpriseScraper, PostScan
+from seen_set import seen_key
+
+
+class APIScraper(EnterpriseScraper):
+    """
+    Browserless backend: pages through a post's comments with instagrapi's
+    private API client. Same run() signature and findings format as
+    EnterpriseScraper; findings have no screenshot (image is None).
+
+    client:    any object with media_pk_from_url / media_id / media_comments_chunk.
+               Defaults to an instagrapi Client logged in with the sessionid
+               from cookies.json. Pass a fake one to run against canned pages.
+    page_size: comments per API round trip.
+    """
+
+    def __init__(self, client=None, page_size=100, **kwargs):
+        super().__init__(**kwargs)
+        self.client = client
+        self.page_size = page_size
+        self.last_cursor = None  # where the last run stopped; pass back as cursor= to resume
+
+    # ---------------------------------------------------------
+    # Client
+    # ---------------------------------------------------------
+    def get_client(self):
+        if self.client is not None:
+            return self.client
+
+        # Imported here: instagrapi is only needed by this backend
+        from instagrapi import Client
+
+        cookies = self.read_cookies() or []
+        session_id = next((c["value"] for c in cookies if c.get("name") == "sessionid"), None)
+        if not session_id:
+            raise RuntimeError("❌ No 'sessionid' cookie in cookies.json, the API backend needs a logged-in session")
+
+        client = Client()
+        client.login_by_sessionid(session_id)
+        print("🍪 API session restored from cookies.json.")
+        self.client = client
+        return client
+
+    @staticmethod
+    def comment_record(comment):
+        """instagrapi Comment (or an equivalent dict) -> the scraper's item dict"""
+        get = comment.get if isinstance(comment, dict) else lambda k, d=None: getattr(comment, k, d)
+        user = get("user")
+        username = user.get("username") if isinstance(user, dict) else getattr(user, "username", None)
+        created = get("created_at_utc") or get("created_at")
+        if isinstance(created, (int, float)):
+            created = datetime.fromtimestamp(created, tz=timezone.utc)
+        return {
+            "pk": str(get("pk")),
+            "text": get("text") or "",
+            "author": username,
+            "timestamp": created.isoformat() if created else None,
+        }
+
+    # ---------------------------------------------------------
+    # MAIN RUN
+    # ---------------------------------------------------------
+    def run(self, url, max_limit, analyzer, cursor=None, on_finding=None, on_progress=None):
+        scan = PostScan(self, url, max_limit, analyzer, on_finding, on_progress)
+        fetched = 0
+        complete = False
+
+        client = self.get_client()
+        media_id = client.media_id(client.media_pk_from_url(url))
+        print(f"🌍 API paging: {url} (media {media_id})" + (f", resuming at {cursor}" if cursor else ""))
+
+        try:
+            while not scan.full:
+                comments, next_cursor = client.media_comments_chunk(media_id, self.page_size, min_id=cursor)
+                scan.passes += 1
+                fetched += len(comments)
+
+                items = []
+                for comment in comments:
+                    item = self.comment_record(comment)
+                    if " ".join(item["text"].split()) and scan.seen.add(seen_key(item["pk"])):
+                        items.append(item)
+                batch = scan.take(items)
+
+                # A whole page (newest first) the last scan already processed: the rest is known
+                if scan.reached_known(bool(comments), batch, 1):
+                    cursor = None
+                    break
+
+                for item, text, res in scan.hits(batch):
+                    scan.record(item, text, res)
+                scan.end_pass({"pages": scan.passes, "comments": fetched, "findings": len(scan.findings)})
+
+                # Advance only once the whole page is processed, so a resume never skips comments
+                if scan.truncated:
+                    break
+                cursor = next_cursor
+                if not cursor or not comments:
+                    print("✅ End of comments reached.")
+                    cursor = None
+                    complete = True
+                    break
+
+        except Exception as e:
+            print(f"⚠️ API error: {e}")
+
+        finally:
+            self.last_cursor = cursor
+            stats = scan.finish(complete)
+            stats["pages"] = stats.pop("passes")
+            self.last_run_stats = dict(stats, comments=fetched, cursor=cursor)
+
+        return scan.findings
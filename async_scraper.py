@@ -0,0 +1,252 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Async Scraper)                           |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+
+import asyncio
+import os
+import re
+import time
+from datetime import datetime
+
+from comment_capture import CommentCapture
+from evidence import HIGHLIGHT_CSS, comment_key
+from scraper import (COMMENT_SELECTOR, EXTRACT_COMMENTS_JS, NODE_IMAGE_URLS_JS, RELOAD_NODE_IMAGES_JS,
+                     WAIT_FOR_GROWTH_JS, EnterpriseScraper, PostScan)
+
+
+class AsyncEnterpriseScraper(EnterpriseScraper):
+    """
+    Sweeps many posts at once: one browser, one context, one page per post,
+    at most `concurrency` pages open. Findings are streamed as they happen.
+    """
+
+    def __init__(self, concurrency=4, **kwargs):
+        super().__init__(**kwargs)
+        self.concurrency = concurrency
+
+    # ---------------------------------------------------------
+    # Page helpers (async twins of the EnterpriseScraper ones)
+    # ---------------------------------------------------------
+    async def wait_for_comments_async(self, page):
+        try:
+            await page.wait_for_selector(COMMENT_SELECTOR, state="attached", timeout=self.first_comment_timeout_ms)
+        except Exception:
+            print("⚠️ No comments rendered yet, continuing anyway.")
+        try:
+            await page.wait_for_load_state("networkidle", timeout=2000)
+        except Exception:
+            pass
+
+    async def wait_for_growth_async(self, page, previous, timeout_ms):
+        try:
+            return await page.evaluate(WAIT_FOR_GROWTH_JS, [COMMENT_SELECTOR, previous, timeout_ms])
+        except Exception:
+            return previous
+
+    async def perform_continuous_scroll_async(self, page, presses=4):
+        try:
+            await page.mouse.click(200, 200)
+            for _ in range(presses):
+                await page.keyboard.press("PageDown")
+            return True
+        except Exception as e:
+            print(f"⚠️ Scroll error: {e}")
+            return False
+
+    async def route_request_async(self, route):
+        if self.should_block(route.request):
+            await route.abort()
+        else:
+            await route.continue_()
+
+    async def capture_evidence_async(self, page, item, text, stem, post_url=None):
+        key = comment_key(item.get("pk"), text, post_url)
+        cached = await asyncio.to_thread(self.evidence.lookup, key)
+        if cached:
+            return cached
+        # allowed_urls is shared by all pages of this scraper; the extra images
+        # let through while another page captures are harmless
+        try:
+            el = self.locate_comment(page, item, text)
+            if self.block_resources:
+                urls = await el.evaluate(NODE_IMAGE_URLS_JS, timeout=3000)
+                self.allowed_urls.update(urls)
+                await el.evaluate(RELOAD_NODE_IMAGES_JS, 2000)
+                self.allowed_urls.difference_update(urls)
+            await el.evaluate("node => node.setAttribute('data-ig-hit', '')", timeout=3000)
+            data = await el.screenshot(style=HIGHLIGHT_CSS, timeout=5000, **self.evidence.screenshot_options())
+            return self.evidence.submit(self.evidence.path_for(stem), data, key=key, post_url=post_url)
+        except Exception:
+            return None
+
+    async def expand_threads_async(self, page):
+        try:
+            for btn in await page.locator("text='View hidden comments'").all():
+                if await btn.is_visible():
+                    before = await page.locator(COMMENT_SELECTOR).count()
+                    await btn.click()
+                    await self.wait_for_growth_async(page, before, 1000)
+
+            reply_btns = await page.locator("div[role='button']:has-text('View replies')").all()
+            for i, btn in enumerate(reply_btns):
+                if i > 3:
+                    break
+                if await btn.is_visible():
+                    try:
+                        await btn.scroll_into_view_if_needed()
+                        before = await page.locator(COMMENT_SELECTOR).count()
+                        await btn.click()
+                        await self.wait_for_growth_async(page, before, 500)
+                    except:
+                        pass
+
+            for btn in await page.locator("text='more'").all():
+                if await btn.is_visible():
+                    try:
+                        await btn.click()
+                    except:
+                        pass
+        except:
+            pass
+
+    # ---------------------------------------------------------
+    # One post
+    # ---------------------------------------------------------
+    async def scan_post(self, context, url, max_limit, analyzer, emit):
+        # PostScan's database calls run in a thread, off the event loop
+        scan = await asyncio.to_thread(PostScan, self, url, max_limit, analyzer)
+        session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        post_key = re.sub(r"[^A-Za-z0-9_-]", "", url.rstrip("/").split("/")[-1].split("?")[0])[:24] or "post"
+        capture = CommentCapture(scan.seen)
+        complete = False
+        known_mark = 0
+        first_comment_s = None
+        page = await context.new_page()
+        capture.attach(page)
+        if self.block_resources:
+            await page.route("**/*", self.route_request_async)
+
+        try:
+            print(f"🌍 Opening: {url}")
+            await page.goto(url, timeout=60000)
+            await self.wait_for_comments_async(page)
+            first_comment_s = round(time.perf_counter() - scan.started, 2)
+
+            stuck_counter = 0
+            last_count = 0
+
+            while not scan.full:
+                if page.is_closed():
+                    break
+                scan.passes += 1
+
+                await self.perform_continuous_scroll_async(page, presses=4)
+                await self.expand_threads_async(page)
+                await self.wait_for_growth_async(page, last_count, self.growth_timeout_ms)
+
+                try:
+                    extracted = await page.evaluate(EXTRACT_COMMENTS_JS, COMMENT_SELECTOR)
+                except Exception as e:
+                    print(f"⚠️ Extraction error: {e}")
+                    extracted = {"total": 0, "items": []}
+                network_items = await capture.drain_async()
+
+                if extracted["total"] == last_count and not network_items:
+                    stuck_counter += 1
+                    if stuck_counter >= self.stuck_limit:
+                        print(f"✅ End of comments detected: {url}")
+                        complete = True
+                        break
+                else:
+                    stuck_counter = 0
+
+                last_count = extracted["total"]
+
+                network_live = capture.comments_seen + capture.comments_known > 0
+                batch = scan.take(network_items, extracted["items"], network_live)
+
+                arrived = bool(extracted["items"]) or capture.comments_known > known_mark
+                known_mark = capture.comments_known
+                if scan.reached_known(arrived, batch, self.known_pass_limit):
+                    break
+
+                for item, text, res in scan.hits(batch):
+                    try:
+                        img_path = await self.capture_evidence_async(page, item, text, os.path.join(
+                            self.evidence_dir, f"evidence_{session_id}_{post_key}_{len(scan.findings)}"), post_url=url)
+                        await emit(scan.record(item, text, res, img_path))
+                    except:
+                        continue
+
+                await asyncio.to_thread(scan.end_pass)
+
+        except Exception as e:
+            print(f"⚠️ Post failed ({url}): {e}")
+        finally:
+            self.last_run_stats[url] = dict(
+                await asyncio.to_thread(scan.finish, complete),
+                first_comment_s=first_comment_s,
+                network_comments=capture.comments_seen,
+                dom_comments=scan.dom_comments,
+                known_comments=capture.comments_known
+            )
+            try:
+                await page.close()
+            except:
+                pass
+
+    # ---------------------------------------------------------
+    # Many posts
+    # ---------------------------------------------------------
+    async def scan_posts(self, urls, max_limit, analyzer):
+        """Async generator of findings across all urls, in the order they are found."""
+        from playwright.async_api import async_playwright
+
+        self.last_run_stats = {}  # per post url
+        queue = asyncio.Queue()
+        done = object()
+        gate = asyncio.Semaphore(self.concurrency)
+
+        async def worker(url):
+            try:
+                async with gate:
+                    await self.scan_post(context, url, max_limit, analyzer, queue.put)
+            finally:
+                await queue.put(done)
+
+        async with async_playwright() as p:
+            print(f"🚀 Launching Scraper ({len(urls)} posts, {self.concurrency} at a time)...")
+            browser = await p.chromium.launch(**self.launch_options)
+            context = await browser.new_context(**self.device_profile(p))
+            cookies = self.read_cookies()
+            if cookies:
+                await context.add_cookies(cookies)
+                print("🍪 Session Cookies Injected.")
+
+            tasks = [asyncio.create_task(worker(u)) for u in urls]
+            try:
+                remaining = len(tasks)
+                while remaining:
+                    item = await queue.get()
+                    if item is done:
+                        remaining -= 1
+                        continue
+                    yield item
+            finally:
+                for t in tasks:
+                    t.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+                await asyncio.to_thread(self.evidence.close)  # image files of every yielded finding exist
+                try:
+                    await browser.close()
+                except:
+                    pass
+
+    def run_many(self, urls, max_limit, analyzer):
+        """Blocking helper: scans all urls concurrently and returns every finding."""
+        async def collect():
+            return [f async for f in self.scan_posts(urls, max_limit, analyzer)]
+        return asyncio.run(collect())
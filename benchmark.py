@@ -0,0 +1,776 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Benchmarks)                              |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+#
+#  Usage:  python benchmark.py <command> [options]
+#          python benchmark.py scan --phrases 20000
+
+import argparse
+import contextlib
+import os
+import random
+import re
+import shutil
+import string
+import subprocess
+import sys
+import tempfile
+import time
+
+from analyzer import HybridAnalyzer
+
+BENIGN = [
+    "what a beautiful picture bhai", "love this so much", "skill issue tbh",
+    "where did you buy that jacket", "kitna mast lag raha hai", "assignment due kal hai",
+    "first comment!!!", "this made my day", "bro you killed it on stage",
+    "class assistant se poochna", "hello dost kaise ho", "see you at the match",
+]
+TOXIC = [
+    "tu chutiya hai", "aaachutiyaaa", "c.h.u.t.i.y.a", "bsdk nikal", "go to hell",
+    "i will kill you", "kamina insaan",
+]
+
+
+def sample_comments(n, toxic_ratio=0.1, seed=42):
+    """Synthetic comment stream with roughly toxic_ratio lexicon hits."""
+    rng = random.Random(seed)
+    out = []
+    for _ in range(n):
+        pool = TOXIC if rng.random() < toxic_ratio else BENIGN
+        out.append(" ".join(rng.choice(pool) for _ in range(rng.randint(1, 3))))
+    return out
+
+
+def synthetic_phrases(n, seed=7):
+    """Random English-looking phrases to pad the strict lexicon (simulates english.csv)."""
+    rng = random.Random(seed)
+    words = ["".join(rng.choice(string.ascii_lowercase) for _ in range(rng.randint(3, 8))) for _ in range(5000)]
+    return {" ".join(rng.choice(words) for _ in range(rng.randint(1, 4))) for _ in range(n)}
+
+
+def per_item(fn, items, repeat=3):
+    """Best-of-N wall time per item, in microseconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for x in items:
+            fn(x)
+        best = min(best, time.perf_counter() - start)
+    return best / len(items) * 1e6
+
+
+# ---------------------------------------------------------
+# scan: per-comment latency of HybridAnalyzer.scan
+# ---------------------------------------------------------
+@contextlib.contextmanager
+def scratch_cwd(prefix):
+    """Runs the block in a throwaway working directory: scrapers keep evidence/ and its databases under it"""
+    root = tempfile.mkdtemp(prefix=prefix)
+    cwd = os.getcwd()
+    os.chdir(root)
+    try:
+        yield root
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(root, ignore_errors=True)
+
+
+def legacy_scan(analyzer, text):
+    """The pre-compilation scan: substring loop + regex rebuilt on every call."""
+    raw_clean = text.lower().strip()
+    variants = [raw_clean, analyzer.normalize_text(raw_clean)]
+    for v in variants:
+        for phrase in analyzer.loose_phrases:
+            if phrase in v:
+                return True
+    if analyzer.strict_phrases:
+        pattern_str = r'\b(' + '|'.join(re.escape(p) for p in analyzer.strict_phrases) + r')\b'
+        for v in variants:
+            if re.search(pattern_str, v):
+                return True
+    return False
+
+
+class CachedRegexMatch:
+    """The strongest pre-automaton baseline: the substring loop plus one strict regex compiled up front."""
+
+    def __init__(self, analyzer):
+        self.loose = list(analyzer.loose_phrases)
+        strict = sorted(analyzer.strict_phrases, key=len, reverse=True)
+        self.strict = re.compile(r'\b(' + '|'.join(map(re.escape, strict)) + r')\b') if strict else None
+
+    def __call__(self, variants):
+        for v in variants:
+            for phrase in self.loose:
+                if phrase in v:
+                    return True
+        if self.strict:
+            for v in variants:
+                if self.strict.search(v):
+                    return True
+        return False
+
+
+def automaton_match(analyzer):
+    loose, strict = analyzer.get_matchers()
+    return lambda variants: any(loose.search(v) for v in variants) or any(strict.search(v) for v in variants)
+
+
+def bench_scan(args):
+    analyzer = HybridAnalyzer()
+    shipped = set(analyzer.strict_phrases)
+    comments = sample_comments(args.comments)
+    # Both variants a scan matches against, prepared once: the sweep times the matching alone
+    variants = [[t.lower().strip(), analyzer.normalize_text(t.lower().strip())] for t in comments]
+
+    analyzer.add_phrases(synthetic_phrases(args.phrases))
+    analyzer.get_matchers()
+    cached = CachedRegexMatch(analyzer)
+
+    print(f"\n📏 {len(analyzer.loose_phrases)} loose / {len(analyzer.strict_phrases)} strict phrases, {len(comments)} comments")
+    before = per_item(lambda t: legacy_scan(analyzer, t), comments[:args.legacy_comments])
+    regex = per_item(lambda t: cached([t.lower().strip(), analyzer.normalize_text(t.lower().strip())]), comments)
+    after = per_item(analyzer.scan, comments)
+    print(f"   before (regex per call) : {before:10.1f} µs/scan")
+    print(f"   cached regex            : {regex:10.1f} µs/scan")
+    print(f"   after  (compiled)       : {after:10.1f} µs/scan")
+    print(f"   speedup                 : {before / after:10.1f}x  ({regex / after:.2f}x vs cached regex)")
+
+    # Where does the automaton start to beat a regex kept between calls?
+    print("\n🔀 Matching only, shipped lexicon + synthetic strict phrases")
+    print(f"   {'strict phrases':>14}{'cached regex':>14}{'automaton':>12}")
+    crossover = None
+    for extra in args.sweep:
+        analyzer.strict_phrases = shipped | synthetic_phrases(extra)
+        regex = per_item(CachedRegexMatch(analyzer), variants)
+        automaton = per_item(automaton_match(analyzer), variants)
+        if crossover is None and automaton < regex:
+            crossover = len(analyzer.strict_phrases)
+        print(f"   {len(analyzer.strict_phrases):>14,}{regex:11.1f} µs{automaton:9.1f} µs")
+    if crossover is None:
+        print("   the cached regex is faster at every size tried")
+    else:
+        print(f"   the automaton wins from ~{crossover:,} strict phrases")
+
+
+# ---------------------------------------------------------
+# batch: scan() loop vs scan_many() throughput
+# ---------------------------------------------------------
+def bench_batch(args):
+    analyzer = HybridAnalyzer()
+    comments = sample_comments(args.comments)
+
+    start = time.perf_counter()
+    for t in comments:
+        analyzer.scan(t)
+    single = time.perf_counter() - start
+
+    start = time.perf_counter()
+    analyzer.scan_many(comments)
+    batched = time.perf_counter() - start
+
+    print(f"\n📦 {len(comments)} comments")
+    print(f"   scan() loop  : {len(comments) / single * 60:12,.0f} comments/min")
+    print(f"   scan_many()  : {len(comments) / batched * 60:12,.0f} comments/min")
+
+
+# ---------------------------------------------------------
+# parallel: scan_parallel() scaling across worker counts
+# ---------------------------------------------------------
+def bench_parallel(args):
+    from parallel_scan import scan_parallel
+
+    comments = sample_comments(args.comments)
+    cores = os.cpu_count() or 1
+    print(f"\n🧵 {len(comments)} comments, {cores} cores available")
+
+    base = None
+    for workers in args.workers:
+        start = time.perf_counter()
+        for _ in scan_parallel(iter(comments), workers=workers, chunksize=args.chunksize):
+            pass
+        rate = len(comments) / (time.perf_counter() - start)
+        base = base or rate
+        note = "" if workers <= cores else "  (more workers than cores)"
+        print(f"   {workers:3d} workers : {rate:12,.0f} comments/s   x{rate / base:5.2f}{note}")
+
+
+# ---------------------------------------------------------
+# importtime: cold start of the lexicon-only path
+# ---------------------------------------------------------
+HEAVY_MODULES = ["pandas", "torch", "transformers", "playwright", "streamlit"]
+
+READY_SNIPPET = """
+import sys, time
+t = time.perf_counter()
+import analyzer
+analyzer.HybridAnalyzer()
+print("READY_MS", (time.perf_counter() - t) * 1000, file=sys.stderr)
+print("HEAVY", ",".join(m for m in %r if m in sys.modules), file=sys.stderr)
+"""
+
+
+def bench_importtime(args):
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", READY_SNIPPET % (HEAVY_MODULES,)],
+        capture_output=True, text=True,
+    )
+    rows, ready_ms, heavy = [], None, ""
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "|" in line:
+            _, cumulative, name = line[len("import time:"):].split("|")
+            if cumulative.strip().isdigit():
+                rows.append((int(cumulative) / 1000, name.rstrip()))
+        elif line.startswith("READY_MS"):
+            ready_ms = float(line.split()[1])
+        elif line.startswith("HEAVY"):
+            heavy = line[len("HEAVY"):].strip()
+
+    if ready_ms is None:
+        print(proc.stderr)
+        sys.exit("❌ analyzer failed to start")
+
+    print("\n🐢 Slowest imports (cumulative ms):")
+    for ms, name in sorted(rows, reverse=True)[:args.top]:
+        print(f"   {ms:8.1f}  {name.strip()}")
+    print(f"\n   heavy modules loaded : {heavy or 'none'}")
+    print(f"   analyzer ready in    : {ready_ms:.1f} ms (budget {args.budget_ms:.0f} ms)")
+    if ready_ms > args.budget_ms or heavy:
+        sys.exit("❌ cold start over budget")
+    print("✅ within budget")
+
+
+# ---------------------------------------------------------
+# ml: CPU throughput and memory per scoring backend
+# ---------------------------------------------------------
+def _rss_mb():
+    with open("/proc/self/status") as f:
+        for line in f:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def _ml_child(backend, model, quantized, n, queue):
+    from ml_scorer import TransformerScorer
+    before = _rss_mb()
+    scorer = TransformerScorer(model, device="cpu", backend=backend, quantized_path=quantized)
+    comments = sample_comments(n)
+    scorer.score_many(comments[:64])  # warm-up
+    start = time.perf_counter()
+    scorer.score_many(comments)
+    rate = n / (time.perf_counter() - start)
+    queue.put((backend, rate, _rss_mb() - before, _rss_mb()))
+
+
+def bench_ml(args):
+    import multiprocessing as mp
+
+    # Each backend in a fresh process so RSS numbers don't mix
+    ctx = mp.get_context("spawn")
+    print(f"\n🧠 {args.comments} comments on CPU")
+    for backend in args.backend:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_ml_child, args=(backend, args.model, args.quantized, args.comments, queue))
+        proc.start()
+        proc.join()
+        if queue.empty():
+            print(f"   {backend:11s}: failed (is the export present?)")
+            continue
+        name, rate, delta, total = queue.get()
+        print(f"   {name:11s}: {rate:8,.0f} comments/s | model RSS +{delta:6.0f} MB (total {total:.0f} MB)")
+
+
+# ---------------------------------------------------------
+# scraper: serial EnterpriseScraper vs AsyncEnterpriseScraper
+# ---------------------------------------------------------
+def bench_scraper(args):
+    from async_scraper import AsyncEnterpriseScraper
+    from fixture_server import start_fixture_server
+    from scraper import EnterpriseScraper
+
+    server, base = start_fixture_server()
+    urls = [f"{base}/p/post{i}/?n={args.comments}" for i in range(args.posts)]
+    analyzer = HybridAnalyzer()
+    # Both sweeps scan the same posts: no resuming from the other sweep's checkpoints
+    browser = {"headless": True, "channel": args.channel, "incremental": False}
+
+    with scratch_cwd("ig-bench-scraper-"):
+        start = time.perf_counter()
+        serial = sum(len(EnterpriseScraper(**browser).run(u, args.limit, analyzer)) for u in urls)
+        serial_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        concurrent = len(AsyncEnterpriseScraper(concurrency=args.concurrency, **browser).run_many(urls, args.limit, analyzer))
+        async_s = time.perf_counter() - start
+    server.shutdown()
+
+    print(f"\n🌐 {args.posts} fixture posts, limit {args.limit} findings/post")
+    print(f"   serial sync  : {serial_s:7.1f} s  ({serial} findings)")
+    print(f"   async x{args.concurrency:<3d}   : {async_s:7.1f} s  ({concurrent} findings)")
+    print(f"   speedup      : {serial_s / async_s:7.1f}x")
+
+
+# ---------------------------------------------------------
+# waits: per-post wall clock with event-driven waits
+# ---------------------------------------------------------
+def bench_waits(args):
+    from fixture_server import start_fixture_server
+    from scraper import EnterpriseScraper
+
+    class FixedSleepScraper(EnterpriseScraper):
+        """The pre-event-driven loop: sleep(6) after goto, fixed sleeps every pass, 16 idle passes to stop"""
+
+        def wait_for_comments(self, page):
+            time.sleep(6)
+
+        def perform_continuous_scroll(self, page, presses=4):
+            page.mouse.click(200, 200)
+            time.sleep(0.2)
+            for _ in range(presses):
+                page.keyboard.press("PageDown")
+                time.sleep(0.4)
+            return True
+
+        def wait_for_growth(self, page, previous, timeout_ms):
+            time.sleep(0.8)
+            return previous
+
+    server, base = start_fixture_server()
+    analyzer = HybridAnalyzer()
+    print(f"\n⏱️ {args.posts} fixture posts x {args.comments} comments, XHR latency {args.latency}s")
+    print(f"   {'post':<8}{'event-driven':>24}{'fixed sleeps':>24}{'speedup':>10}")
+
+    with scratch_cwd("ig-bench-waits-"):
+        for i in range(args.posts):
+            url = f"{base}/p/wait{i}/?n={args.comments}&latency={args.latency}"
+            runs = []
+            for cls in (EnterpriseScraper, FixedSleepScraper):
+                bot = cls(headless=True, channel=args.channel, incremental=False)
+                if cls is FixedSleepScraper:
+                    bot.stuck_limit = 16
+                bot.run(url, 10**6, analyzer)
+                runs.append(bot.last_run_stats)
+            new, old = runs
+            print(f"   {i:<8}{new['seconds']:9.1f} s /{new['passes']:4d} passes"
+                  f"{old['seconds']:9.1f} s /{old['passes']:4d} passes{old['seconds'] / new['seconds']:9.1f}x")
+    server.shutdown()
+
+
+# ---------------------------------------------------------
+# capture: network-captured vs DOM-scraped comments
+# ---------------------------------------------------------
+def bench_capture(args):
+    from fixture_server import start_fixture_server
+    from scraper import EnterpriseScraper
+
+    server, base = start_fixture_server()
+    analyzer = HybridAnalyzer()
+    print("\n📡 Comment source per run (network = parsed JSON responses, dom = clean_text fallback)")
+
+    with scratch_cwd("ig-bench-capture-"):
+        for label, query in (("REST XHR", f"n={args.comments}"), ("GraphQL replay", "source=graphql")):
+            bot = EnterpriseScraper(headless=True, channel=args.channel, incremental=False)
+            findings = bot.run(f"{base}/p/capture/?{query}&latency={args.latency}", 10**6, analyzer)
+            stats = bot.last_run_stats
+            with_ids = sum(1 for f in findings if f.get("comment_id") and f.get("author"))
+            print(f"   {label:<15} {stats['network_comments']:5d} network / {stats['dom_comments']:5d} dom comments, "
+                  f"{len(findings)} findings ({with_ids} with id+author) in {stats['seconds']:.1f} s")
+    server.shutdown()
+
+
+# ---------------------------------------------------------
+# pool: fresh browser per scan vs BrowserPool
+# ---------------------------------------------------------
+def bench_pool(args):
+    from browser_pool import BrowserPool
+    from fixture_server import start_fixture_server
+    from scraper import EnterpriseScraper
+
+    server, base = start_fixture_server()
+    analyzer = HybridAnalyzer()
+    urls = [f"{base}/p/pool{i}/?n={args.comments}&latency=0.01" for i in range(args.posts)]
+    print(f"\n♻️ {args.posts} fixture posts, limit {args.limit}: fresh browser per scan vs pooled")
+
+    # The warm runs re-scan the cold runs' posts: without incremental off they would only resume
+    with scratch_cwd("ig-bench-pool-"):
+        started = time.perf_counter()
+        for u in urls:
+            EnterpriseScraper(headless=True, channel=args.channel, incremental=False).run(u, args.limit, analyzer)
+        cold = (time.perf_counter() - started) / len(urls)
+
+        pool = BrowserPool(EnterpriseScraper(headless=True, channel=args.channel, incremental=False),
+                           recycle_after=args.recycle_after,
+                           storage_state=os.path.join("evidence", "bench_storage_state.json"))
+        pool.scan(urls[0], args.limit, analyzer)  # first launch is paid once per app process
+        started = time.perf_counter()
+        for u in urls:
+            pool.scan(u, args.limit, analyzer)
+        warm = (time.perf_counter() - started) / len(urls)
+        pool.close()
+    server.shutdown()
+
+    print(f"   fresh browser : {cold:6.2f} s/scan")
+    print(f"   browser pool  : {warm:6.2f} s/scan  ({cold / warm:.1f}x), {pool.stats}")
+
+
+# ---------------------------------------------------------
+# blocking: headless resource blocking on a heavy-media post
+# ---------------------------------------------------------
+def bench_blocking(args):
+    from fixture_server import start_fixture_server
+    from scraper import EnterpriseScraper
+
+    server, base = start_fixture_server()
+    analyzer = HybridAnalyzer()
+    print(f"\n🚫 Heavy-media fixture post ({args.comments} comments, avatars, hero images, video, font, beacons)")
+
+    with scratch_cwd("ig-bench-blocking-"):
+        for blocked in (False, True):
+            server.bytes_served = 0
+            bot = EnterpriseScraper(headless=True, channel=args.channel, block_resources=blocked, incremental=False)
+            findings = bot.run(f"{base}/p/heavy/?heavy=1&n={args.comments}&latency=0.02", args.limit, analyzer)
+            stats = bot.last_run_stats
+            shots = sum(1 for f in findings if f["image"])
+            print(f"   {'blocking' if blocked else 'no blocking':<12} {server.bytes_served / 1e6:7.2f} MB served, "
+                  f"first comment {stats['first_comment_s']} s, total {stats['seconds']} s, {shots} screenshots")
+    server.shutdown()
+
+
+# ---------------------------------------------------------
+# evidence: full-page PNG vs element clips on a hit-heavy post
+# ---------------------------------------------------------
+def bench_evidence(args):
+    from fixture_server import start_fixture_server
+    from scraper import EnterpriseScraper
+
+    class FullPageEvidence(EnterpriseScraper):
+        """The pre-pipeline capture: scroll, restyle, full-page PNG to disk, restyle back"""
+
+        def capture_evidence(self, page, item, text, stem, post_url=None):
+            try:
+                el = self.locate_comment(page, item, text)
+                el.scroll_into_view_if_needed(timeout=3000)
+                el.evaluate("node => { node.style.border = '3px solid red'; node.style.backgroundColor = 'rgba(255,0,0,0.1)'; }")
+                page.screenshot(path=stem + ".png")
+                el.evaluate("node => { node.style.border = ''; node.style.backgroundColor = ''; }")
+                return stem + ".png"
+            except Exception:
+                return None
+
+    server, base = start_fixture_server()
+    analyzer = HybridAnalyzer()
+    url = f"{base}/p/hits/?n={args.comments}&toxic={args.toxic_ratio}&latency=0.02"
+    print(f"\n📸 Hit-heavy fixture post: {args.comments} comments, {args.toxic_ratio:.0%} toxic")
+
+    # Every run scans the same post in full: incremental off, so none resumes from the one before
+    with scratch_cwd("ig-bench-evidence-"):
+        runs = [("full-page png", FullPageEvidence(headless=True, channel=args.channel, incremental=False))]
+        for fmt in args.formats:
+            bot = EnterpriseScraper(headless=True, channel=args.channel, evidence_format=fmt,
+                                    evidence_quality=args.quality, incremental=False)
+            bot.evidence.store = None  # plain files: every run pays for its own captures
+            runs.append((f"clip {fmt}", bot))
+        for label, bot in runs:
+            findings = bot.run(url, 10**6, analyzer)
+            stats = bot.last_run_stats
+            files = [f["image"] for f in findings if f["image"]]
+            size = sum(os.path.getsize(f) for f in files) / max(len(files), 1) / 1e3
+            print(f"   {label:<14} {stats['seconds']:6.1f} s for {len(findings)} hits, {len(files)} images, "
+                  f"{size:7.1f} KB/image")
+    server.shutdown()
+
+
+# ---------------------------------------------------------
+# seen: dedup memory over a long thread
+# ---------------------------------------------------------
+def _seen_child(kind, n, checkpoints, fp_rate, queue):
+    from seen_set import make_seen_set, seen_key
+
+    rng = random.Random(3)
+    phrases = BENIGN + TOXIC
+    before = _rss_mb()
+    seen = set() if kind == "strings" else make_seen_set(kind, capacity=n, fp_rate=fp_rate)
+    rows = []
+    for i in range(1, n + 1):
+        # Comment-sized text, unique per i, built on the fly so only the seen-set keeps anything
+        text = f"{i} " + " ".join(rng.choice(phrases) for _ in range(rng.randint(2, 6)))
+        seen.add(seen_key(None, text))
+        if i in checkpoints:
+            rows.append((i, _rss_mb() - before))
+    queue.put((kind, rows))
+
+
+def bench_seen(args):
+    import multiprocessing as mp
+
+    ctx = mp.get_context("spawn")
+    checkpoints = sorted(set(args.checkpoints + [args.comments]))
+    print(f"\n🧮 RSS growth of the seen-comment set (MB) vs comments scanned")
+    print("   " + "comments".rjust(10) + "".join(k.rjust(10) for k in args.kinds))
+    results = {}
+    for kind in args.kinds:
+        queue = ctx.Queue()
+        proc = ctx.Process(target=_seen_child, args=(kind, args.comments, set(checkpoints), args.fp_rate, queue))
+        proc.start()
+        proc.join()
+        results[kind] = dict(queue.get()[1])
+    for n in checkpoints:
+        print("   " + f"{n:>10,}" + "".join(f"{results[k].get(n, 0):10.1f}" for k in args.kinds))
+
+
+# ---------------------------------------------------------
+# thumbs: dashboard image bytes, full captures vs served thumbnails
+# ---------------------------------------------------------
+def bench_thumbs(args):
+    import json
+    import urllib.request
+    from PIL import Image, ImageDraw
+    from evidence_server import evidence_urls, start_evidence_server
+
+    rng = random.Random(5)
+    with scratch_cwd("ig-thumbs-") as root:  # full-size screenshots, removed afterwards
+        findings = []
+        for i in range(args.findings):
+            img = Image.new("RGB", (args.width, args.height), (250, 250, 250))
+            draw = ImageDraw.Draw(img)
+            for _ in range(60):  # comment rows, avatars and text-ish noise
+                x, y = rng.randrange(args.width), rng.randrange(args.height)
+                draw.rectangle([x, y, x + rng.randint(20, 400), y + rng.randint(8, 40)],
+                               fill=tuple(rng.randrange(256) for _ in range(3)))
+            path = os.path.join(root, f"evidence_{i}.png")
+            img.save(path)
+            findings.append({"user": f"@user{i}", "text": rng.choice(TOXIC), "reason": "Lexicon", "image": path})
+
+        legacy = len(json.dumps(findings)) + sum(os.path.getsize(f["image"]) for f in findings)
+
+        server, _ = start_evidence_server(root, host="127.0.0.1", port=0)
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+        page = [dict({k: v for k, v in f.items() if k != "image"}, **evidence_urls(f["image"], base_url, root))
+                for f in findings[:args.page_size]]
+        started = time.perf_counter()
+        for f in page:
+            urllib.request.urlopen(f["thumb"]).read()
+        cold = time.perf_counter() - started
+        thumbs = server.bytes_served
+        started = time.perf_counter()
+        for f in page:
+            urllib.request.urlopen(f["thumb"]).read()
+        warm = time.perf_counter() - started
+        server.shutdown()
+        paged = len(json.dumps(page)) + thumbs
+
+    print(f"\n🖼️ First results view, {args.findings} findings of {args.width}x{args.height} evidence")
+    print(f"   {'legacy (all findings + full images)':<38}{legacy / 1e6:8.2f} MB")
+    print(f"   {f'page of {args.page_size} + thumbnails':<38}{paged / 1e6:8.2f} MB  ({legacy / paged:.0f}x less)")
+    print(f"   thumbnail generation {cold * 1000 / len(page):.1f} ms each, cached {warm * 1000 / len(page):.1f} ms each")
+
+
+# ---------------------------------------------------------
+# findings: SQLite findings store at dashboard scale
+# ---------------------------------------------------------
+FINDING_REASONS = ["Direct Match (High Risk): 'bsdk'", "Exact Match: 'go to hell'", "ML Classifier: 91% toxic",
+                   "Hidden/Obfuscated Match: 'chutiya' in 'chutiyaaa'", "Phrase Match: 'i will kill you'"]
+
+
+def _fake_findings(rng, start, n, posts):
+    return [{
+        "text": f"{rng.choice(TOXIC)} #{i}",
+        "reason": rng.choice(FINDING_REASONS),
+        "link": f"https://www.instagram.com/p/POST{rng.randrange(posts)}/",
+        "image": None,
+        "author": f"user_{rng.randrange(100000)}",
+        "timestamp": 1760000000 + i,
+        "comment_id": str(10**12 + i),
+    } for i in range(start, start + n)]
+
+
+def bench_findings(args):
+    import statistics
+    from findings_db import FindingsDB
+
+    rng = random.Random(9)
+    with scratch_cwd("ig-findings-") as root:  # the default 1M rows are ~400 MB of SQLite
+        db = FindingsDB(os.path.join(root, "findings.sqlite3"))
+        t0 = time.time() - 90 * 86400
+        started = time.perf_counter()
+        for start in range(0, args.rows, args.batch):
+            n = min(args.batch, args.rows - start)
+            db.add_findings(_fake_findings(rng, start, n, args.posts), found_at=t0 + start * 90 * 86400 / args.rows)
+        batched = args.rows / (time.perf_counter() - started)
+
+        # Baseline on the full table: one transaction per finding
+        started = time.perf_counter()
+        for row in _fake_findings(rng, args.rows, args.single_rows, args.posts):
+            db.add_findings([row], found_at=time.time() - 90 * 86400)
+        single = args.single_rows / (time.perf_counter() - started)
+
+        print(f"\n🗄️ Findings database, {args.rows:,} rows ({os.path.getsize(db.path) / 1e6:.0f} MB)")
+        print(f"   insert, 1 per transaction   {single:10,.0f} rows/s")
+        print(f"   insert, {args.batch} per transaction {batched:10,.0f} rows/s")
+
+        def timed(fn):
+            samples = []
+            for _ in range(args.repeat):
+                started = time.perf_counter()
+                fn()
+                samples.append((time.perf_counter() - started) * 1000)
+            return statistics.median(samples)
+
+        post = "https://www.instagram.com/p/POST7/"
+        cases = [
+            ("newest page", {}),
+            ("one post", {"post_url": post}),
+            ("one reason", {"reason": "Exact Match"}),
+            ("last 24 h", {"since": time.time() - 86400}),
+            ("post + reason", {"post_url": post, "reason": "Exact Match"}),
+        ]
+        print(f"   {'query (median ms)':<18}{'rows':>10}{'count':>10}{'page 1':>10}{'page 100':>10}")
+        for label, query in cases:
+            total = db.count(**query)
+            count_ms = timed(lambda: db.count(**query))
+            first_ms = timed(lambda: db.query(**query, limit=24))
+            deep_ms = timed(lambda: db.query(**query, limit=24, offset=99 * 24))
+            print(f"   {label:<18}{total:>10,}{count_ms:10.2f}{first_ms:10.2f}{deep_ms:10.2f}")
+        print(f"   reason filter options {timed(db.reasons):.2f} ms")
+
+
+# ---------------------------------------------------------
+# rescan: hourly monitoring of a big thread with checkpoints
+# ---------------------------------------------------------
+def bench_rescan(args):
+    import io
+    from api_scraper import APIScraper
+    from fixture_server import FixtureClient
+
+    analyzer = HybridAnalyzer()
+    url = "https://www.instagram.com/p/RESCAN/"
+    print(f"\n⏩ Re-scan of a {args.comments:,}-comment thread, {args.latency * 1000:.0f} ms per API page")
+    print(f"   {'run':<34}{'pages':>7}{'analyzed':>10}{'findings':>10}{'seconds':>9}")
+    for incremental in (False, True):
+        with scratch_cwd("ig-rescan-"):
+            runs = [("first scan", 0)] + [(f"{'incremental' if incremental else 'full'}, +{args.new} new", args.new * h)
+                                          for h in range(1, args.hours + 1)]
+            for label, new in runs:
+                bot = APIScraper(client=FixtureClient(args.comments, args.latency, new=new), incremental=incremental)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    findings = bot.run(url, 10**9, analyzer)
+                stats = bot.last_run_stats
+                print(f"   {label:<34}{stats['pages']:>7}{stats['analyzed']:>10,}{len(findings):>10}{stats['seconds']:>9.2f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="InstaGuard micro-benchmarks")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("scan", help="per-scan latency, legacy regex vs compiled matchers")
+    p.add_argument("--phrases", type=int, default=5000, help="extra strict phrases to load")
+    p.add_argument("--comments", type=int, default=5000)
+    p.add_argument("--legacy-comments", type=int, default=200, help="legacy path is slow, sample fewer")
+    p.add_argument("--sweep", type=int, nargs="+", default=[0, 250, 1000, 2500, 5000, 10000, 20000],
+                   help="synthetic strict phrases added to the shipped lexicon, per sweep step")
+    p.set_defaults(func=bench_scan)
+
+    p = sub.add_parser("batch", help="scan() loop vs scan_many() throughput")
+    p.add_argument("--comments", type=int, default=200000)
+    p.set_defaults(func=bench_batch)
+
+    p = sub.add_parser("parallel", help="scan_parallel() scaling, e.g. --workers 1 2 4 8 16")
+    p.add_argument("--comments", type=int, default=1000000)
+    p.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    p.add_argument("--chunksize", type=int, default=2000)
+    p.set_defaults(func=bench_parallel)
+
+    p = sub.add_parser("importtime", help="python -X importtime check of analyzer cold start")
+    p.add_argument("--budget-ms", type=float, default=150.0)
+    p.add_argument("--top", type=int, default=10)
+    p.set_defaults(func=bench_importtime)
+
+    p = sub.add_parser("ml", help="comments/s and RSS for fp32 vs int8 CPU backends")
+    p.add_argument("--backend", nargs="+", default=["fp32", "torch-int8", "onnx"])
+    p.add_argument("--model", default="engine/model_v1")
+    p.add_argument("--quantized", default="engine/model_v1_int8", help="export dir; run 'instaguard export-model' per format")
+    p.add_argument("--comments", type=int, default=2000)
+    p.set_defaults(func=bench_ml)
+
+    p = sub.add_parser("scraper", help="serial vs concurrent post sweep on the local fixture site")
+    p.add_argument("--posts", type=int, default=8)
+    p.add_argument("--concurrency", type=int, default=4)
+    p.add_argument("--comments", type=int, default=120, help="comments per fixture post")
+    p.add_argument("--limit", type=int, default=5, help="findings per post before stopping")
+    p.add_argument("--channel", default=None, help="browser channel, e.g. msedge (default: bundled chromium)")
+    p.set_defaults(func=bench_scraper)
+
+    p = sub.add_parser("waits", help="per-post wall clock on the fixture site, event-driven vs fixed sleeps")
+    p.add_argument("--posts", type=int, default=3)
+    p.add_argument("--comments", type=int, default=150)
+    p.add_argument("--latency", type=float, default=0.05, help="fixture comments XHR latency (s)")
+    p.add_argument("--channel", default=None)
+    p.set_defaults(func=bench_waits)
+
+    p = sub.add_parser("capture", help="network-captured vs DOM-scraped comments on the fixture site")
+    p.add_argument("--comments", type=int, default=150, help="comments on the REST fixture post")
+    p.add_argument("--latency", type=float, default=0.05)
+    p.add_argument("--channel", default=None)
+    p.set_defaults(func=bench_capture)
+
+    p = sub.add_parser("pool", help="per-scan wall clock, fresh browser vs BrowserPool")
+    p.add_argument("--posts", type=int, default=6)
+    p.add_argument("--comments", type=int, default=60)
+    p.add_argument("--limit", type=int, default=3)
+    p.add_argument("--recycle-after", type=int, default=25)
+    p.add_argument("--channel", default=None)
+    p.set_defaults(func=bench_pool)
+
+    p = sub.add_parser("blocking", help="bytes and time-to-first-comment with and without resource blocking")
+    p.add_argument("--comments", type=int, default=120)
+    p.add_argument("--limit", type=int, default=5)
+    p.add_argument("--channel", default=None)
+    p.set_defaults(func=bench_blocking)
+
+    p = sub.add_parser("evidence", help="hit-heavy post: full-page PNG captures vs queued element clips")
+    p.add_argument("--comments", type=int, default=150)
+    p.add_argument("--toxic-ratio", type=float, default=0.5)
+    p.add_argument("--formats", nargs="+", default=["png", "jpeg", "webp"])
+    p.add_argument("--quality", type=int, default=70)
+    p.add_argument("--channel", default=None)
+    p.set_defaults(func=bench_evidence)
+
+    p = sub.add_parser("seen", help="RSS vs comments scanned: set of strings vs 64-bit hashes vs Bloom filter")
+    p.add_argument("--comments", type=int, default=1000000)
+    p.add_argument("--checkpoints", type=int, nargs="+", default=[10000, 100000, 250000, 500000])
+    p.add_argument("--kinds", nargs="+", default=["strings", "hash", "bloom"])
+    p.add_argument("--fp-rate", type=float, default=1e-4)
+    p.set_defaults(func=bench_seen)
+
+    p = sub.add_parser("thumbs", help="bytes to render the results view: full evidence images vs paged thumbnails")
+    p.add_argument("--findings", type=int, default=200)
+    p.add_argument("--page-size", type=int, default=24)
+    p.add_argument("--width", type=int, default=1170)
+    p.add_argument("--height", type=int, default=2532)
+    p.set_defaults(func=bench_thumbs)
+
+    p = sub.add_parser("findings", help="findings database insert throughput and filtered query latency")
+    p.add_argument("--rows", type=int, default=1000000)
+    p.add_argument("--batch", type=int, default=500)
+    p.add_argument("--single-rows", type=int, default=5000)
+    p.add_argument("--posts", type=int, default=2000)
+    p.add_argument("--repeat", type=int, default=5)
+    p.set_defaults(func=bench_findings)
+
+    p = sub.add_parser("rescan", help="hourly re-scans of a growing thread, full vs checkpointed (API backend, offline)")
+    p.add_argument("--comments", type=int, default=10000)
+    p.add_argument("--new", type=int, default=50, help="comments posted per hour")
+    p.add_argument("--hours", type=int, default=3)
+    p.add_argument("--latency", type=float, default=0.05, help="seconds per API page")
+    p.set_defaults(func=bench_rescan)
+
+    args = parser.parse_args()
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,212 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Browser Pool)                            |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+
+import atexit
+import os
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from scraper import EnterpriseScraper
+
+STORAGE_STATE = "storage_state.json"
+COOKIE_FILE = "cookies.json"  # what EnterpriseScraper.load_cookies() reads
+
+
+class BrowserPool:
+    """
+    One warm browser + iPhone context, kept alive across scans.
+
+    Sync Playwright objects belong to the thread that created them, and
+    Streamlit reruns the script on different threads, so the pool owns a
+    dedicated thread: jobs are handed to it and their results come back as
+    futures. Each job gets a fresh page in the warm context.
+
+    - health check before every job (browser connected, context answering)
+    - browser + context recycled after `recycle_after` pages
+    - session saved with context.storage_state() and reloaded from it;
+      cookies.json is read when no storage state exists yet or when it is
+      newer than the state (re-exported); a change is picked up on the next job
+    """
+
+    def __init__(self, scraper=None, recycle_after=25, storage_state=STORAGE_STATE):
+        self.scraper = scraper or EnterpriseScraper()
+        self.recycle_after = recycle_after
+        self.storage_state = storage_state
+        self.stats = {"launches": 0, "pages": 0, "recycles": 0, "unhealthy": 0}
+
+        self._p = None
+        self._browser = None
+        self._context = None
+        self._pages_on_context = 0
+        self._cookies_at = None  # mtime of cookies.json when the context was built
+        self._error = None  # why the pool thread stopped, if it failed
+        self._jobs = queue.Queue()
+        self._thread = threading.Thread(target=self._loop, name="browser-pool", daemon=True)
+        self._thread.start()
+        atexit.register(self.close)
+
+    # ---------------------------------------------------------
+    # Caller side (any thread)
+    # ---------------------------------------------------------
+    def submit(self, fn, *args, **kwargs):
+        """Runs fn(page, *args, **kwargs) on the pool thread. Returns a Future."""
+        future = Future()
+        if not self._thread.is_alive():
+            future.set_exception(self._stopped())
+            return future
+        self._jobs.put((future, fn, args, kwargs))
+        if not self._thread.is_alive():
+            self._fail_pending()  # the thread died while we queued: nobody else will pick it up
+        return future
+
+    @property
+    def alive(self):
+        """False once the pool thread has stopped (closed, or playwright failed): submit() then fails fast"""
+        return self._thread.is_alive()
+
+    def run(self, fn, *args, **kwargs):
+        return self.submit(fn, *args, **kwargs).result()
+
+    def scan(self, url, max_limit, analyzer, scraper=None, **hooks):
+        """Same result as EnterpriseScraper.run(), without the browser start-up"""
+        return self.run((scraper or self.scraper).scan_page, url, max_limit, analyzer, **hooks)
+
+    def close(self, timeout=10):
+        if self._thread.is_alive():
+            self._jobs.put(None)
+            self._thread.join(timeout)
+
+    # ---------------------------------------------------------
+    # Pool thread
+    # ---------------------------------------------------------
+    def _loop(self):
+        try:
+            # Imported here so the dashboard renders before playwright loads
+            from playwright.sync_api import sync_playwright
+
+            with sync_playwright() as p:
+                self._p = p
+                while True:
+                    job = self._jobs.get()
+                    if job is None:
+                        break
+                    future, fn, args, kwargs = job
+                    if not future.set_running_or_notify_cancel():
+                        continue
+                    try:
+                        page = self._new_page()
+                        try:
+                            future.set_result(fn(page, *args, **kwargs))
+                        finally:
+                            self._release(page)
+                    except BaseException as e:
+                        future.set_exception(e)
+                self._shutdown()
+        except BaseException as e:
+            # Playwright failed to start (or died): jobs waiting on this thread would block forever
+            print(f"⚠️ Browser pool stopped: {e}")
+            self._error = e
+        finally:
+            self._fail_pending()
+
+    def _stopped(self):
+        if self._error is not None:
+            return RuntimeError(f"Browser pool failed: {self._error}")
+        return RuntimeError("Browser pool is closed")
+
+    def _fail_pending(self):
+        """Fails every queued job; called once the pool thread is gone"""
+        while True:
+            try:
+                job = self._jobs.get_nowait()
+            except queue.Empty:
+                return
+            if job is not None and job[0].set_running_or_notify_cancel():
+                job[0].set_exception(self._stopped())
+
+    def _healthy(self):
+        if self._browser is None or self._context is None or not self._browser.is_connected():
+            return False
+        try:
+            self._context.cookies()  # one round trip, fails if the context is gone
+            return True
+        except Exception:
+            return False
+
+    def _launch(self):
+        # Decided before _shutdown() saves the old context's state over the file
+        cookies_at = self._cookies_mtime()
+        use_state = os.path.exists(self.storage_state) and (
+            cookies_at is None or os.path.getmtime(self.storage_state) >= cookies_at)
+
+        self._shutdown()
+        started = time.perf_counter()
+        self._browser = self._p.chromium.launch(**self.scraper.launch_options)
+        profile = self.scraper.device_profile(self._p)
+
+        if use_state:
+            self._context = self._browser.new_context(storage_state=self.storage_state, **profile)
+        else:
+            # No state yet, or cookies.json was re-exported after it: the cookies win
+            self._context = self._browser.new_context(**profile)
+            if self.scraper.load_cookies(self._context):
+                self._save_state()
+        self._cookies_at = cookies_at
+
+        self._pages_on_context = 0
+        self.stats["launches"] += 1
+        print(f"🚀 Browser pool warm in {time.perf_counter() - started:.1f}s")
+
+    def _new_page(self):
+        if not self._healthy():
+            if self._browser is not None:
+                self.stats["unhealthy"] += 1
+                print("⚠️ Pooled browser unhealthy, relaunching.")
+            self._launch()
+        elif self._pages_on_context >= self.recycle_after:
+            self.stats["recycles"] += 1
+            self._launch()
+        elif self._cookies_mtime() != self._cookies_at:
+            print("🍪 cookies.json changed, reloading the session.")
+            self._launch()
+
+        self._pages_on_context += 1
+        self.stats["pages"] += 1
+        return self._context.new_page()
+
+    def _cookies_mtime(self):
+        try:
+            return os.path.getmtime(COOKIE_FILE)
+        except OSError:
+            return None
+
+    def _release(self, page):
+        try:
+            page.close()
+        except Exception:
+            pass
+        self._save_state()
+
+    def _save_state(self):
+        """Keeps refreshed session cookies for the next launch"""
+        try:
+            self._context.storage_state(path=self.storage_state)
+        except Exception:
+            pass
+
+    def _shutdown(self):
+        if self._context is not None:
+            self._save_state()
+        if self._browser is not None:
+            try:
+                self._browser.close()
+            except Exception:
+                pass
+        self._browser = None
+        self._context = None
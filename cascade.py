@@ -0,0 +1,88 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Cascade Module)                          |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+
+import threading
+
+
+def obfuscation_score(raw, normalized):
+    """
+    Share of the comment that normalize_text() had to strip or collapse.
+    'c.h.u.u.u.t.i.y.a' scores high, plain sentences score ~0.
+    """
+    raw_len = len(raw.replace(" ", ""))
+    if not raw_len:
+        return 0.0
+    return 1.0 - len(normalized.replace(" ", "")) / raw_len
+
+
+class CascadePolicy:
+    """
+    Decides which lexicon results are sent on to the ML tier.
+
+    mode:
+      "misses"     - every comment the lexicon did not flag (default)
+      "borderline" - only misses that look obfuscated (obfuscation_score)
+      "all"        - everything; hits keep their verdict but get an ml_score
+      "off"        - lexicon only
+    """
+
+    MODES = ("misses", "borderline", "all", "off")
+
+    def __init__(self, mode="misses", ml_threshold=0.7, obfuscation_threshold=0.3, min_length=3):
+        if mode not in self.MODES:
+            raise ValueError(f"❌ Unknown cascade mode '{mode}', expected one of {self.MODES}")
+        self.mode = mode
+        self.ml_threshold = ml_threshold
+        self.obfuscation_threshold = obfuscation_threshold
+        self.min_length = min_length
+
+    def wants_ml(self, result, raw, normalized):
+        if self.mode == "off" or len(raw) < self.min_length:
+            return False
+        if result["is_toxic"]:
+            # Lexicon hits are already a confident 1.0
+            return self.mode == "all"
+        if self.mode == "borderline":
+            return obfuscation_score(raw, normalized) >= self.obfuscation_threshold
+        return True
+
+
+class CascadeStats:
+    """Per-tier counters: comments seen, time spent and hits, for tuning ML spend."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.tiers = {
+                "lexicon": {"count": 0, "seconds": 0.0, "hits": 0},
+                "ml": {"count": 0, "seconds": 0.0, "hits": 0},
+            }
+
+    def record(self, tier, count, seconds, hits):
+        with self._lock:
+            t = self.tiers[tier]
+            t["count"] += count
+            t["seconds"] += seconds
+            t["hits"] += hits
+
+    def summary(self):
+        with self._lock:
+            out = {}
+            for name, t in self.tiers.items():
+                out[name] = {
+                    "count": t["count"],
+                    "hits": t["hits"],
+                    "hit_rate": round(t["hits"] / t["count"], 4) if t["count"] else 0.0,
+                    "latency_ms": round(t["seconds"] / t["count"] * 1000, 4) if t["count"] else 0.0,
+                    "seconds": round(t["seconds"], 3),
+                }
+            scanned = self.tiers["lexicon"]["count"]
+            out["ml_per_1k"] = round(self.tiers["ml"]["count"] / scanned * 1000, 1) if scanned else 0.0
+            return out
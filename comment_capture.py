@@ -0,0 +1,112 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Network Capture Module)                  |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+
+from collections import deque
+from datetime import datetime, timezone
+
+from seen_set import SeenHashes, seen_key
+
+# Responses worth parsing: GraphQL queries and the REST comments endpoint
+URL_HINTS = ("/graphql", "/api/v1/media/")
+
+
+def _is_comment(node):
+    user = node.get("user")
+    return (
+        isinstance(node.get("text"), str)
+        and (node.get("pk") or node.get("id"))
+        and isinstance(user, dict) and user.get("username")
+        and ("created_at" in node or "created_at_utc" in node)
+    )
+
+
+def _timestamp(value):
+    try:
+        return datetime.fromtimestamp(int(value), tz=timezone.utc).isoformat()
+    except (TypeError, ValueError, OverflowError):
+        return None
+
+
+def extract_comments(payload):
+    """
+    Every comment-shaped object in an Instagram JSON payload (REST or GraphQL),
+    in document order. Replies nested under a comment are included.
+    """
+    out = []
+
+    def walk(node):
+        if isinstance(node, dict):
+            if _is_comment(node):
+                out.append({
+                    "pk": str(node.get("pk") or node.get("id")),
+                    "text": node["text"],
+                    "author": node["user"]["username"],
+                    "timestamp": _timestamp(node.get("created_at", node.get("created_at_utc"))),
+                })
+            for key, value in node.items():
+                if key != "user":
+                    walk(value)
+        elif isinstance(node, list):
+            for value in node:
+                walk(value)
+
+    walk(payload)
+    return out
+
+
+class CommentCapture:
+    """
+    Collects comments from the JSON the app fetches while we scroll.
+    The response handler only queues responses; parsing happens in drain(),
+    on the scraper's own thread/loop, so the event dispatcher never blocks.
+    """
+
+    def __init__(self, seen=None):
+        self._responses = deque()
+        self._seen = SeenHashes() if seen is None else seen  # may be shared with DOM dedup
+        self.comments_seen = 0
+        self.comments_known = 0  # parsed but already in the seen set (e.g. restored from a checkpoint)
+
+    def attach(self, page):
+        page.on("response", self.on_response)
+
+    def on_response(self, response):
+        if not any(h in response.url for h in URL_HINTS):
+            return
+        if "json" not in (response.headers.get("content-type") or ""):
+            return
+        self._responses.append(response)
+
+    def _accept(self, payload):
+        fresh = []
+        for c in extract_comments(payload):
+            if self._seen.add(seen_key(c["pk"])):
+                fresh.append(c)
+            else:
+                self.comments_known += 1
+        self.comments_seen += len(fresh)
+        return fresh
+
+    def drain(self):
+        """New comments since the last call (sync Playwright)"""
+        fresh = []
+        while self._responses:
+            try:
+                fresh.extend(self._accept(self._responses.popleft().json()))
+            except Exception:
+                continue
+        return fresh
+
+    async def drain_async(self):
+        """New comments since the last call (async Playwright)"""
+        fresh = []
+        while self._responses:
+            try:
+                fresh.extend(self._accept(await self._responses.popleft().json()))
+            except Exception:
+                continue
+        return fresh
@@ -0,0 +1,109 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Comment Stream Module)                   |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+
+import csv
+import json
+import os
+import sys
+
+# Column / key names we accept as the comment body, in priority order
+TEXT_FIELDS = ["text", "comment", "tweet", "body", "content", "message"]
+
+
+def _open(source):
+    """Accepts a path, '-' for stdin, or an already-open text file."""
+    if source == "-":
+        return sys.stdin, False
+    if isinstance(source, (str, os.PathLike)):
+        return open(source, "r", encoding="utf-8", newline=""), True
+    return source, False
+
+
+def _detect_format(source, fmt):
+    if fmt:
+        return fmt
+    name = str(source if isinstance(source, (str, os.PathLike)) else getattr(source, "name", "")).lower()
+    if name.endswith(".csv"):
+        return "csv"
+    if name.endswith((".jsonl", ".ndjson", ".json")):
+        return "jsonl"
+    return "txt"
+
+
+def _find_field(keys):
+    """First of TEXT_FIELDS among keys (any case), or None"""
+    lowered = {k.strip().lower(): k for k in keys if isinstance(k, str)}
+    for name in TEXT_FIELDS:
+        if name in lowered:
+            return lowered[name]
+    return None
+
+
+def _pick_field(keys, field):
+    col = field or _find_field(keys)
+    if col is None:
+        raise ValueError(f"❌ No comment column found. Columns: {list(keys)}")
+    return col
+
+
+def iter_records(source, field=None, fmt=None):
+    """
+    Streams (record, text) pairs from a CSV / JSONL / plain-text export.
+    Nothing is read ahead, so memory does not grow with the file size.
+    fmt is 'csv', 'jsonl' or 'txt' (one comment per line); guessed from the extension.
+    """
+    fmt = _detect_format(source, fmt)
+    f, owned = _open(source)
+    try:
+        if fmt == "csv":
+            reader = csv.DictReader(f)
+            col = _pick_field(reader.fieldnames or [], field)
+            for row in reader:
+                yield row, row.get(col) or ""
+
+        elif fmt == "jsonl":
+            col = field
+            first_keys = None  # keys of the first object, for the error if no line has a text field
+            for line in f:
+                line = line.strip()
+                if not line: continue
+                try:
+                    obj = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if isinstance(obj, str):
+                    yield {"text": obj}, obj
+                    continue
+                if not isinstance(obj, dict):
+                    continue  # 123, [], null: valid JSON but no record, skipped like malformed lines
+                if col is None:
+                    # Detected on the first object that has one; objects before it have no comment
+                    col = _find_field(obj.keys())
+                    if col is None:
+                        first_keys = list(obj) if first_keys is None else first_keys
+                        continue
+                text = obj.get(col)
+                if text is None and not field:
+                    other = _find_field(obj.keys())  # this record names its text field differently
+                    text = obj.get(other) if other else None
+                yield obj, str(text or "")
+            if col is None and first_keys is not None:
+                raise ValueError(f"❌ No comment field found. Keys: {first_keys}")
+
+        else:
+            for line in f:
+                line = line.rstrip("\r\n")
+                yield {"text": line}, line
+    finally:
+        if owned:
+            f.close()
+
+
+def iter_comments(source, field=None, fmt=None):
+    """Just the comment texts, ready for HybridAnalyzer.scan_many / iter_scan."""
+    for _, text in iter_records(source, field, fmt):
+        yield text
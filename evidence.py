@@ -0,0 +1,256 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Evidence Module)                         |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+
+import hashlib
+import os
+import queue
+import sqlite3
+import threading
+import time
+
+FORMATS = ("png", "jpeg", "webp")
+EXTENSIONS = {"png": ".png", "jpeg": ".jpg", "webp": ".webp"}
+
+# Applied only while the clip is taken; the comment node is tagged data-ig-hit
+HIGHLIGHT_CSS = "[data-ig-hit] { box-shadow: inset 0 0 0 3px red !important; background: rgba(255,0,0,0.1) !important; }"
+
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS blobs (
+    sha256     TEXT PRIMARY KEY,
+    path       TEXT NOT NULL,
+    bytes      INTEGER NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS evidence (
+    comment_key TEXT PRIMARY KEY,
+    sha256      TEXT NOT NULL REFERENCES blobs(sha256),
+    post_url    TEXT,
+    first_seen  REAL NOT NULL,
+    last_seen   REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS evidence_sha ON evidence(sha256);
+CREATE INDEX IF NOT EXISTS evidence_last_seen ON evidence(last_seen);
+"""
+
+
+def comment_key(comment_id=None, text=None, post_url=None):
+    """Stable id for a comment: its Instagram pk, else a hash of post + text"""
+    if comment_id:
+        return f"pk:{comment_id}"
+    digest = hashlib.sha256(f"{post_url or ''}\n{text or ''}".encode("utf-8")).hexdigest()
+    return f"txt:{digest[:32]}"
+
+
+class EvidenceStore:
+    """
+    Content-addressed evidence: evidence/objects/<ab>/<cd>/<sha256>.<ext>
+    plus a SQLite index (evidence/index.sqlite3) mapping comment key ->
+    blob, post URL and first/last seen. Identical screenshots share one
+    file; a comment already on record is a lookup, not a capture.
+    """
+
+    def __init__(self, root="evidence"):
+        self.root = root
+        self.objects = os.path.join(root, "objects")
+        self.index_path = os.path.join(root, "index.sqlite3")
+        self._local = threading.local()  # sqlite connections are per thread
+
+    def _db(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            os.makedirs(self.root, exist_ok=True)
+            db = sqlite3.connect(self.index_path, timeout=30)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.executescript(INDEX_SCHEMA)
+            self._local.db = db
+        return db
+
+    def blob_path(self, sha, ext):
+        return os.path.join(self.objects, sha[:2], sha[2:4], sha + ext)
+
+    def lookup(self, key):
+        """Path of the evidence already stored for a comment key, or None"""
+        db = self._db()
+        row = db.execute(
+            "SELECT b.path FROM evidence e JOIN blobs b ON b.sha256 = e.sha256 WHERE e.comment_key = ?", (key,)
+        ).fetchone()
+        if row is None or not os.path.exists(row[0]):
+            return None
+        with db:
+            db.execute("UPDATE evidence SET last_seen = ? WHERE comment_key = ?", (time.time(), key))
+        return row[0]
+
+    def put(self, path, data, key, post_url=None):
+        """Writes the blob unless its content is already stored, then indexes it. Returns True if written."""
+        sha = os.path.splitext(os.path.basename(path))[0]
+        now = time.time()
+        written = False
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp = path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(data)
+            os.replace(tmp, path)  # readers never see half a file
+            written = True
+
+        db = self._db()
+        with db:
+            db.execute("INSERT OR IGNORE INTO blobs VALUES (?, ?, ?, ?)", (sha, path, len(data), now))
+            db.execute(
+                "INSERT INTO evidence VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT(comment_key) DO UPDATE SET sha256 = excluded.sha256, last_seen = excluded.last_seen",
+                (key, sha, post_url, now, now),
+            )
+        return written
+
+    def gc(self, max_age_days=None, dry_run=False):
+        """
+        Drops index entries not seen for max_age_days (None keeps them all),
+        then deletes blobs no entry references and stray files under objects/.
+        """
+        db = self._db()
+        stats = {"entries": 0, "blobs": 0, "bytes": 0}
+        with db:
+            if max_age_days is not None:
+                cutoff = time.time() - max_age_days * 86400
+                stats["entries"] = db.execute(
+                    "SELECT COUNT(*) FROM evidence WHERE last_seen < ?", (cutoff,)).fetchone()[0]
+                if not dry_run:
+                    db.execute("DELETE FROM evidence WHERE last_seen < ?", (cutoff,))
+
+            # In a dry run the doomed entries still exist, so count them as gone
+            keep_after = cutoff if max_age_days is not None and dry_run else 0
+            live = {row[0] for row in db.execute(
+                "SELECT DISTINCT sha256 FROM evidence WHERE last_seen >= ?", (keep_after,))}
+
+            for sha, path, size in db.execute("SELECT sha256, path, bytes FROM blobs").fetchall():
+                if sha in live:
+                    continue
+                stats["blobs"] += 1
+                stats["bytes"] += size
+                if not dry_run:
+                    db.execute("DELETE FROM blobs WHERE sha256 = ?", (sha,))
+                    for stale in (path, os.path.join(self.root, "thumbs", sha + ".webp")):
+                        if os.path.exists(stale):
+                            os.remove(stale)
+
+        # Files the index never heard of (crash between write and insert, manual copies).
+        # Indexed paths may be absolute or relative to another cwd, so compare resolved
+        # paths, and never treat a file named after an indexed blob as stray.
+        rows = db.execute("SELECT sha256, path FROM blobs").fetchall()
+        known = {os.path.realpath(path) for _, path in rows}
+        known_shas = {sha for sha, _ in rows}
+        for folder, _, files in os.walk(self.objects):
+            for name in files:
+                path = os.path.join(folder, name)
+                if name.endswith(".tmp") and time.time() - os.path.getmtime(path) < 3600:
+                    continue  # a write in progress
+                if os.path.realpath(path) not in known and os.path.splitext(name)[0] not in known_shas:
+                    stats["blobs"] += 1
+                    stats["bytes"] += os.path.getsize(path)
+                    if not dry_run:
+                        os.remove(path)
+        return stats
+
+
+class EvidenceWriter:
+    """
+    Screenshot options plus a background writer for evidence clips.
+    The scan loop only captures bytes and submit()s them; disk writes
+    happen on the writer thread. flush() before handing paths to anyone.
+
+    fmt:     "png" (lossless), "jpeg" or "webp" (quality 0-100)
+    scale:   "css" (1 px per CSS px, small files) or "device" (3x on the iPhone profile)
+    store:   EvidenceStore to dedupe into; None writes plain files at the given paths
+    """
+
+    def __init__(self, fmt="png", quality=80, scale="css", max_pending=256, store=None):
+        if fmt not in FORMATS:
+            raise ValueError(f"❌ Unknown evidence format '{fmt}', expected one of {FORMATS}")
+        self.fmt = fmt
+        self.quality = quality
+        self.scale = scale
+        self.store = store
+        self.stats = {"files": 0, "bytes": 0, "write_seconds": 0.0, "errors": 0, "reused": 0, "deduped": 0}
+        self._queue = queue.Queue(max_pending)  # bounded: a stalled disk slows capture instead of eating RAM
+        self._pending = {}  # comment key -> path, submitted but maybe not indexed yet
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def screenshot_options(self):
+        options = {"type": self.fmt, "scale": self.scale}
+        if self.fmt != "png":
+            options["quality"] = self.quality
+        return options
+
+    def path_for(self, stem):
+        """evidence/<stem> + the extension of the configured format"""
+        return stem + EXTENSIONS[self.fmt]
+
+    def lookup(self, key):
+        """Evidence already captured for this comment (this run or an earlier one), or None"""
+        if self.store is None or key is None:
+            return None
+        path = self._pending.get(key) or self.store.lookup(key)
+        if path:
+            self.stats["reused"] += 1
+        return path
+
+    def submit(self, path, data, key=None, post_url=None):
+        """
+        Queues bytes for writing and returns the final path right away.
+        With a store the path is content-addressed and `path` is ignored.
+        """
+        if self.store is not None and key is not None:
+            path = self.store.blob_path(hashlib.sha256(data).hexdigest(), EXTENSIONS[self.fmt])
+            self._pending[key] = path
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._loop, name="evidence-writer", daemon=True)
+                self._thread.start()
+        self._queue.put((path, data, key, post_url))
+        return path
+
+    def flush(self):
+        """Blocks until every submitted file is on disk"""
+        self._queue.join()
+
+    def close(self, timeout=None):
+        """Writes what is queued, then stops the writer thread. A later submit() starts a new one."""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout)
+
+    def _loop(self):
+        while True:
+            job = self._queue.get()
+            if job is None:
+                self._queue.task_done()
+                return
+            path, data, key, post_url = job
+            started = time.perf_counter()
+            try:
+                if self.store is not None and key is not None:
+                    written = self.store.put(path, data, key, post_url)
+                    self._pending.pop(key, None)
+                    if not written:
+                        self.stats["deduped"] += 1
+                        continue
+                else:
+                    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+                    with open(path, "wb") as f:
+                        f.write(data)
+                self.stats["files"] += 1
+                self.stats["bytes"] += len(data)
+            except Exception as e:
+                self.stats["errors"] += 1
+                print(f"⚠️ Evidence write failed ({path}): {e}")
+            finally:
+                self.stats["write_seconds"] += time.perf_counter() - started
+                self._queue.task_done()
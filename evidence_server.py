@@ -0,0 +1,168 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Evidence Server)                         |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+#
+#  Serves evidence screenshots to the dashboard iframe over HTTP:
+#    /thumb/<path under evidence/>?v=<mtime>  downscaled WebP, cached in evidence/thumbs/
+#    /full/<path under evidence/>?v=<mtime>   the original capture, fetched only on click
+#  Both are immutable for a given ?v, so the browser never asks twice.
+#  Only evidence images are served: blobs under objects/ and legacy evidence_*.png
+#  captures, never the SQLite indexes or anything else in the folder.
+#
+#  The dashboard's browser must reach this server. When the dashboard is opened
+#  from another machine, bind it with INSTAGUARD_EVIDENCE_HOST / _PORT and set
+#  INSTAGUARD_EVIDENCE_URL to the address browsers use (or a reverse-proxy path).
+#
+#  Usage:  python evidence_server.py --port 8766
+
+import argparse
+import hashlib
+import mimetypes
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import quote, unquote, urlparse
+
+THUMB_SIZE = (360, 360)  # bounding box, aspect ratio kept
+THUMB_QUALITY = 60
+THUMBS_DIR = "thumbs"
+CACHE_CONTROL = "public, max-age=31536000, immutable"
+IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
+
+
+def is_evidence_image(rel):
+    """True for paths (relative to the evidence root) this server may hand out"""
+    rel = rel.replace(os.sep, "/")
+    if os.path.splitext(rel)[1].lower() not in IMAGE_EXTENSIONS:
+        return False
+    return rel.startswith("objects/") or ("/" not in rel and rel.startswith("evidence_"))
+
+
+def thumbnail_path(root, rel):
+    """evidence/thumbs/<name>.webp; blob names are already content hashes, plain files are hashed by path"""
+    name = os.path.splitext(os.path.basename(rel))[0]
+    if not rel.replace("\\", "/").startswith("objects/"):
+        name = hashlib.sha256(rel.encode("utf-8")).hexdigest()[:32]
+    return os.path.join(root, THUMBS_DIR, name + ".webp")
+
+
+def make_thumbnail(src, dst, size=THUMB_SIZE, quality=THUMB_QUALITY):
+    """Downscaled WebP copy of src at dst (Pillow, imported on first use)"""
+    from PIL import Image
+
+    os.makedirs(os.path.dirname(dst), exist_ok=True)
+    with Image.open(src) as img:
+        img.thumbnail(size)
+        tmp = dst + ".tmp"
+        img.convert("RGB").save(tmp, "WEBP", quality=quality, method=4)
+    os.replace(tmp, dst)
+    return dst
+
+
+def ensure_thumbnail(root, rel):
+    """Thumbnail for evidence file root/rel, generated on first request and cached on disk"""
+    src = os.path.join(root, rel)
+    dst = thumbnail_path(root, rel)
+    if not os.path.exists(dst) or os.path.getmtime(dst) < os.path.getmtime(src):
+        make_thumbnail(src, dst)
+    return dst
+
+
+class EvidenceHandler(BaseHTTPRequestHandler):
+    def log_message(self, *args):
+        pass
+
+    def _resolve(self, rel):
+        """Absolute path of an evidence image inside the root, or None (outside it, or not evidence)"""
+        root = os.path.realpath(self.server.root)
+        path = os.path.realpath(os.path.join(root, rel))
+        if not path.startswith(root + os.sep) or not os.path.isfile(path):
+            return None
+        if not is_evidence_image(os.path.relpath(path, root)):
+            return None
+        return path
+
+    def _send_file(self, path, content_type):
+        etag = '"%x-%x"' % (os.path.getsize(path), int(os.path.getmtime(path) * 1000))
+        if self.headers.get("If-None-Match") == etag:
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("Cache-Control", CACHE_CONTROL)
+            self.end_headers()
+            return
+        with open(path, "rb") as f:
+            body = f.read()
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("Cache-Control", CACHE_CONTROL)
+        self.send_header("ETag", etag)
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.bytes_served += len(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        kind, _, rel = unquote(url.path).lstrip("/").partition("/")
+        path = self._resolve(rel) if kind in ("thumb", "full") else None
+        if path is None:
+            self.send_error(404)
+            return
+
+        if kind == "full":
+            return self._send_file(path, mimetypes.guess_type(path)[0] or "application/octet-stream")
+        try:
+            return self._send_file(ensure_thumbnail(self.server.root, os.path.relpath(path, os.path.realpath(self.server.root))),
+                                   "image/webp")
+        except ImportError:
+            # No Pillow: the full image still works, just heavier
+            return self._send_file(path, mimetypes.guess_type(path)[0] or "application/octet-stream")
+        except Exception as e:
+            print(f"⚠️ Thumbnail failed ({rel}): {e}")
+            self.send_error(500)
+
+
+def start_evidence_server(root="evidence", host=None, port=None, public_url=None):
+    """
+    Serves root on a background thread. Returns (server, base_url).
+    host / port / public_url default to INSTAGUARD_EVIDENCE_HOST (127.0.0.1),
+    INSTAGUARD_EVIDENCE_PORT (any free port) and INSTAGUARD_EVIDENCE_URL
+    (http://host:port); base_url is the public one, used in <img> tags.
+    """
+    host = host or os.environ.get("INSTAGUARD_EVIDENCE_HOST", "127.0.0.1")
+    port = int(os.environ.get("INSTAGUARD_EVIDENCE_PORT", 0)) if port is None else port
+    public_url = public_url or os.environ.get("INSTAGUARD_EVIDENCE_URL")
+    server = ThreadingHTTPServer((host, port), EvidenceHandler)
+    server.root = root
+    server.bytes_served = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, (public_url or f"http://{host}:{server.server_address[1]}").rstrip("/")
+
+
+def evidence_urls(image_path, base_url, root="evidence"):
+    """{"thumb", "full"} URLs for a finding's image path, or None if it is not under root"""
+    if not image_path or not os.path.exists(image_path):
+        return None
+    rel = os.path.relpath(os.path.realpath(image_path), os.path.realpath(root))
+    if rel.startswith("..") or not is_evidence_image(rel):
+        return None
+    quoted = quote(rel.replace(os.sep, "/"))
+    version = int(os.path.getmtime(image_path))
+    return {"thumb": f"{base_url}/thumb/{quoted}?v={version}", "full": f"{base_url}/full/{quoted}?v={version}"}
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Evidence thumbnail server")
+    parser.add_argument("--root", default="evidence")
+    parser.add_argument("--host", help="bind address (default: INSTAGUARD_EVIDENCE_HOST or 127.0.0.1)")
+    parser.add_argument("--port", type=int, default=8766)
+    args = parser.parse_args()
+    server, base = start_evidence_server(args.root, host=args.host, port=args.port)
+    print(f"🖼️ Evidence on {base}/thumb/<path>  (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,204 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Findings Database)                       |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+
+from evidence import comment_key
+
+FINDINGS_SCHEMA = """
+CREATE TABLE IF NOT EXISTS findings (
+    id          INTEGER PRIMARY KEY,
+    comment_key TEXT NOT NULL UNIQUE,
+    post_url    TEXT NOT NULL,
+    comment_id  TEXT,
+    author      TEXT,
+    text        TEXT NOT NULL,
+    reason      TEXT,
+    kind        TEXT,
+    image       TEXT,
+    timestamp   TEXT,
+    comment_at  REAL,
+    found_at    REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS findings_post ON findings(post_url, found_at);
+CREATE INDEX IF NOT EXISTS findings_kind ON findings(kind, found_at);
+CREATE INDEX IF NOT EXISTS findings_post_kind ON findings(post_url, kind, found_at);
+CREATE INDEX IF NOT EXISTS findings_found_at ON findings(found_at);
+CREATE TABLE IF NOT EXISTS scans (
+    post_url          TEXT PRIMARY KEY,
+    last_run          REAL NOT NULL,
+    newest_comment_at REAL,
+    comments          INTEGER NOT NULL,
+    findings          INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    post_url   TEXT PRIMARY KEY,
+    version    TEXT NOT NULL,
+    seen       BLOB NOT NULL,
+    depth      INTEGER NOT NULL,
+    complete   INTEGER NOT NULL,
+    updated_at REAL NOT NULL,
+    since      REAL
+);
+"""
+
+COLUMNS = ("id", "comment_key", "post_url", "comment_id", "author", "text", "reason", "kind", "image", "timestamp",
+           "comment_at", "found_at")
+
+
+def reason_kind(reason):
+    """Filterable part of an analyzer reason: Exact Match: 'x' -> Exact Match"""
+    return reason.split(":", 1)[0].strip() if reason else None
+
+
+def comment_epoch(timestamp):
+    """Unix time of a comment timestamp (epoch number or ISO string), or None if it can't be read"""
+    if timestamp is None or timestamp == "":
+        return None
+    if isinstance(timestamp, (int, float)):
+        return float(timestamp)
+    try:
+        return datetime.fromisoformat(str(timestamp).replace("Z", "+00:00")).timestamp()
+    except ValueError:
+        return None
+
+
+class FindingsDB:
+    """
+    Every finding ever made, in SQLite (WAL, so the dashboard reads while a
+    scan writes), plus per post: a record of its last scan and a checkpoint
+    to resume from. Scrapers write a pass at a time with
+    add_findings(); the dashboard filters and pages with query() / count().
+    """
+
+    def __init__(self, path="evidence/findings.sqlite3"):
+        self.path = path
+        self._local = threading.local()  # sqlite connections are per thread
+
+    def _db(self):
+        db = getattr(self._local, "db", None)
+        if db is None:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            db = sqlite3.connect(self.path, timeout=30)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute("PRAGMA synchronous=NORMAL")  # WAL stays consistent; only the last commits can roll back
+            db.executescript(FINDINGS_SCHEMA)
+            if "since" not in [row[1] for row in db.execute("PRAGMA table_info(checkpoints)")]:
+                db.execute("ALTER TABLE checkpoints ADD COLUMN since REAL")  # databases from before the cut-off moved here
+            self._local.db = db
+        return db
+
+    # ---------------------------------------------------------
+    # Writes (scraper side)
+    # ---------------------------------------------------------
+    def add_findings(self, findings, found_at=None):
+        """Stores a batch of scraper findings in one transaction. A comment already on record is updated, not duplicated."""
+        if not findings:
+            return 0
+        now = found_at or time.time()
+        rows = [(
+            comment_key(f.get("comment_id"), f["text"], f["link"]), f["link"], f.get("comment_id"), f.get("author"),
+            f["text"], f.get("reason"), reason_kind(f.get("reason")), f.get("image"), f.get("timestamp"),
+            comment_epoch(f.get("timestamp")), now,
+        ) for f in findings]
+        db = self._db()
+        with db:
+            db.executemany(
+                "INSERT INTO findings (comment_key, post_url, comment_id, author, text, reason, kind, image, timestamp, "
+                "comment_at, found_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT(comment_key) DO UPDATE SET reason = excluded.reason, kind = excluded.kind, "
+                "image = COALESCE(excluded.image, findings.image)",
+                rows,
+            )
+        return len(rows)
+
+    def record_scan(self, post_url, comments, findings, newest_comment_at=None):
+        """Bookkeeping for a finished run; newest_comment_at only moves forward"""
+        db = self._db()
+        with db:
+            db.execute(
+                "INSERT INTO scans VALUES (?, ?, ?, ?, ?) ON CONFLICT(post_url) DO UPDATE SET "
+                "last_run = excluded.last_run, comments = excluded.comments, findings = excluded.findings, "
+                "newest_comment_at = MAX(COALESCE(scans.newest_comment_at, 0), COALESCE(excluded.newest_comment_at, 0))",
+                (post_url, time.time(), newest_comment_at, comments, findings),
+            )
+
+    def checkpoint(self, post_url):
+        """Last checkpoint of a post: {version, seen, depth, complete, since}, or None"""
+        row = self._db().execute(
+            "SELECT version, seen, depth, complete, since FROM checkpoints WHERE post_url = ?", (post_url,)).fetchone()
+        if row is None:
+            return None
+        return {"version": row[0], "seen": row[1], "depth": row[2], "complete": bool(row[3]), "since": row[4]}
+
+    def save_checkpoint(self, post_url, version, seen, depth, complete, since=None):
+        """
+        version:  analyzer.version() the comments were judged with
+        seen:     serialized seen set (seen_set.load_seen_set restores it)
+        depth:    scroll passes (or API pages) the deepest scan went
+        complete: that scan reached the end of the thread
+        since:    comments at or before this time were analyzed under `version` (None: no cut-off)
+        """
+        db = self._db()
+        with db:
+            db.execute("INSERT OR REPLACE INTO checkpoints (post_url, version, seen, depth, complete, updated_at, since) "
+                       "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                       (post_url, version, seen, depth, int(complete), time.time(), since))
+
+    # ---------------------------------------------------------
+    # Reads (dashboard side)
+    # ---------------------------------------------------------
+    @staticmethod
+    def _where(post_url=None, reason=None, since=None):
+        clauses, params = [], []
+        if post_url:
+            clauses.append("post_url = ?")
+            params.append(post_url)
+        if reason:
+            clauses.append("kind = ?")
+            params.append(reason)
+        if since:
+            clauses.append("found_at >= ?")
+            params.append(since)
+        return (" WHERE " + " AND ".join(clauses) if clauses else ""), params
+
+    def query(self, post_url=None, reason=None, since=None, limit=24, offset=0):
+        """Newest first, in the scrapers' finding format (plus id, found_at)"""
+        where, params = self._where(post_url, reason, since)
+        rows = self._db().execute(
+            f"SELECT {', '.join(COLUMNS)} FROM findings{where} ORDER BY found_at DESC, id DESC LIMIT ? OFFSET ?",
+            params + [limit, offset],
+        ).fetchall()
+        out = []
+        for row in rows:
+            record = dict(zip(COLUMNS, row))
+            record["link"] = record.pop("post_url")
+            out.append(record)
+        return out
+
+    def count(self, post_url=None, reason=None, since=None):
+        where, params = self._where(post_url, reason, since)
+        return self._db().execute(f"SELECT COUNT(*) FROM findings{where}", params).fetchone()[0]
+
+    def posts(self):
+        """Scanned post URLs, most recently scanned first"""
+        return [row[0] for row in self._db().execute("SELECT post_url FROM scans ORDER BY last_run DESC")]
+
+    def reasons(self):
+        """Distinct reason kinds, the values query(reason=...) filters on"""
+        # Loose index scan over findings_kind: one seek per kind instead of a walk over every row
+        db = self._db()
+        out = []
+        row = db.execute("SELECT MIN(kind) FROM findings").fetchone()
+        while row and row[0] is not None:
+            out.append(row[0])
+            row = db.execute("SELECT MIN(kind) FROM findings WHERE kind > ?", (row[0],)).fetchone()
+        return out
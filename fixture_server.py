@@ -0,0 +1,237 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Local Fixture Site)                      |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+#
+#  Static stand-in for an Instagram post page, for benchmarks only.
+#  Comments load in pages from a JSON endpoint as the page is scrolled.
+#  With ?source=graphql the page instead replays the recorded GraphQL
+#  responses in fixtures/graphql_comments_<cursor>.json.
+#
+#  Usage:  python fixture_server.py --port 8765
+#          open http://127.0.0.1:8765/p/demo/?n=300
+#          open http://127.0.0.1:8765/p/demo/?source=graphql
+#          open http://127.0.0.1:8765/p/demo/?heavy=1   (hero images, video, web font, beacons)
+
+import argparse
+import json
+import os
+import random
+import threading
+import time
+import zlib
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+BENIGN = [
+    "what a beautiful picture", "love this so much", "skill issue tbh", "where is this place",
+    "kitna mast lag raha hai", "first comment", "this made my day", "see you at the match",
+]
+TOXIC = ["tu chutiya hai", "bsdk nikal yaha se", "kamina insaan", "go to hell"]
+
+PAGE_SIZE = 15
+RECORDED_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "fixtures")
+GRAPHQL_CONNECTION = "xdt_api__v1__media__media_id__comments__connection"
+
+# ?heavy=1: what a real post page pulls in besides comment text
+HEAVY_HTML = """
+<style>
+  @font-face { font-family: Fixture; src: url(/media/fixture.woff2) format("woff2"); }
+  body { font-family: Fixture, sans-serif; }
+</style>
+<img src="/media/hero_1.jpg" width="390"><img src="/media/hero_2.jpg" width="390">
+<img src="/media/hero_3.jpg" width="390"><img src="/media/hero_4.jpg" width="390">
+<video src="/media/clip.mp4" preload="auto" muted autoplay loop width="390"></video>
+<script>setInterval(() => fetch("/ajax/bz?t=" + Date.now()), 500);</script>
+"""
+MEDIA_BYTES = {".jpg": 250_000, ".mp4": 2_000_000, ".woff2": 120_000}
+AVATAR_BYTES = 15_000
+MEDIA_TYPES = {".jpg": "image/jpeg", ".mp4": "video/mp4", ".woff2": "font/woff2"}
+
+PAGE_HTML = """<!doctype html>
+<html><head><meta charset="utf-8"><title>Post __POST__</title></head>
+<body>
+<div role="dialog">
+  <article><h2>__POST__</h2><p>Fixture post body.</p>__HEAVY__</article>
+  <ul id="comments"></ul>
+  <div id="sentinel" style="height:40px">Loading...</div>
+</div>
+<script>
+  const POST = "__POST__", QUERY = "__QUERY__";
+  const GRAPHQL = new URLSearchParams(QUERY).get("source") === "graphql";
+  const HEAVY = new URLSearchParams(QUERY).get("heavy") === "1";
+  let cursor = "", loading = false, done = false;
+
+  function render(c) {
+    const li = document.createElement("li");
+    li.dataset.pk = c.pk;
+    const avatar = HEAVY ? `<img src="/media/avatar_${c.pk}.jpg" width="32" height="32">` : "";
+    li.innerHTML = `<div>${avatar}<h3><a href="/${c.user.username}/">${c.user.username}</a></h3>
+      <span>${c.text}</span><div><time datetime="${new Date(c.created_at * 1000).toISOString()}">2h</time>
+      <span>${c.like_count ?? c.comment_like_count} likes</span><div role="button">Reply</div></div></div>`;
+    document.getElementById("comments").appendChild(li);
+  }
+
+  async function loadMore() {
+    if (loading || done) return;
+    loading = true;
+    if (GRAPHQL) {
+      const res = await fetch(`/graphql/query/?after=${cursor}&${QUERY}`);
+      const conn = (await res.json()).data.__CONNECTION__;
+      conn.edges.forEach(e => render(e.node));
+      cursor = conn.page_info.end_cursor || "";
+      done = !conn.page_info.has_next_page;
+    } else {
+      const res = await fetch(`/api/v1/media/${POST}/comments/?min_id=${cursor}&${QUERY}`);
+      const data = await res.json();
+      data.comments.forEach(render);
+      cursor = data.next_min_id || "";
+      done = !data.has_more_comments;
+    }
+    if (done) document.getElementById("sentinel").textContent = "";
+    loading = false;
+    const s = document.getElementById("sentinel").getBoundingClientRect();
+    if (s.top < window.innerHeight * 2) loadMore();
+  }
+
+  window.addEventListener("scroll", () => {
+    const s = document.getElementById("sentinel").getBoundingClientRect();
+    if (s.top < window.innerHeight * 2) loadMore();
+  }, {passive: true});
+  loadMore();
+</script>
+</body></html>
+"""
+
+
+def make_comments(post, n, toxic_ratio=0.1):
+    """Deterministic comment list for a post id"""
+    rng = random.Random(post)
+    out = []
+    for i in range(n):
+        pool = TOXIC if rng.random() < toxic_ratio else BENIGN
+        out.append({
+            "pk": f"{zlib.crc32(post.encode()) % 10**6}{i:06d}",
+            "text": f"{rng.choice(pool)} #{i}",
+            "created_at": 1760000000 - i * 60,
+            "like_count": rng.randint(0, 99),
+            "user": {"username": f"user_{rng.randint(1, 9999)}"},
+        })
+    return out
+
+
+class FixtureHandler(BaseHTTPRequestHandler):
+    latency = 0.05  # seconds per comments XHR, overridden by ?latency=
+
+    def log_message(self, *args):
+        pass
+
+    def _send(self, body, content_type, status=200):
+        body = body.encode() if isinstance(body, str) else body
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+        self.server.bytes_served += len(body)
+
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = parse_qs(url.query)
+        parts = [p for p in url.path.split("/") if p]
+
+        # /p/<post>/ -> comment page
+        if len(parts) == 2 and parts[0] == "p":
+            html = (PAGE_HTML.replace("__POST__", parts[1]).replace("__QUERY__", url.query)
+                    .replace("__CONNECTION__", GRAPHQL_CONNECTION)
+                    .replace("__HEAVY__", HEAVY_HTML if query.get("heavy") == ["1"] else ""))
+            return self._send(html, "text/html; charset=utf-8")
+
+        # /api/v1/media/<post>/comments/?min_id=<cursor>&n=<total>&toxic=<ratio>
+        if len(parts) == 5 and parts[:3] == ["api", "v1", "media"] and parts[4] == "comments":
+            time.sleep(float(query.get("latency", [self.latency])[0]))
+            comments = make_comments(parts[3], int(query.get("n", [200])[0]), float(query.get("toxic", [0.1])[0]))
+            start = int(query.get("min_id", ["0"])[0] or 0)
+            page = comments[start:start + PAGE_SIZE]
+            more = start + PAGE_SIZE < len(comments)
+            payload = {
+                "comments": page,
+                "next_min_id": str(start + PAGE_SIZE) if more else None,
+                "has_more_comments": more,
+                "status": "ok",
+            }
+            return self._send(json.dumps(payload), "application/json")
+
+        # /media/<name>.<ext> -> filler bytes sized like real media; /ajax/bz -> logging beacon
+        if len(parts) == 2 and parts[0] == "media":
+            ext = os.path.splitext(parts[1])[1]
+            size = AVATAR_BYTES if parts[1].startswith("avatar_") else MEDIA_BYTES.get(ext, 10_000)
+            return self._send(b"\0" * size, MEDIA_TYPES.get(ext, "application/octet-stream"))
+        if parts[:2] == ["ajax", "bz"]:
+            return self._send("{}", "application/json")
+
+        # /graphql/query/?after=<cursor> -> recorded response fixtures/graphql_comments_<cursor>.json
+        if parts[:2] == ["graphql", "query"]:
+            time.sleep(float(query.get("latency", [self.latency])[0]))
+            after = query.get("after", ["0"])[0] or "0"
+            path = os.path.join(RECORDED_DIR, f"graphql_comments_{int(after)}.json")
+            if os.path.exists(path):
+                with open(path, "rb") as f:
+                    return self._send(f.read(), "application/json")
+
+        self._send("not found", "text/plain", 404)
+
+
+class FixtureClient:
+    """
+    Offline stand-in for instagrapi.Client (APIScraper's client=): serves
+    make_comments() in cursor pages, like media_comments_chunk does.
+    new: comments posted since, served first (newest first, as the API does).
+    """
+
+    def __init__(self, n=200, latency=0.0, new=0):
+        self.n = n
+        self.latency = latency
+        self.new = new
+        self.calls = []
+
+    def media_pk_from_url(self, url):
+        return [p for p in urlparse(url).path.split("/") if p][-1]
+
+    def media_id(self, media_pk):
+        return f"{media_pk}_1"
+
+    def media_comments_chunk(self, media_id, max_amount, min_id=None):
+        self.calls.append(min_id)
+        time.sleep(self.latency)
+        comments = make_comments(media_id.split("_")[0], self.n)
+        fresh = make_comments(media_id.split("_")[0] + "-new", self.new)
+        for i, c in enumerate(fresh):
+            c["pk"] = "9" + c["pk"]
+            c["created_at"] = 1760000000 + 60 * (i + 1)  # after every make_comments() comment
+        comments = fresh[::-1] + comments
+        start = int(min_id or 0)
+        end = start + max_amount
+        return comments[start:end], (str(end) if end < len(comments) else None)
+
+
+def start_fixture_server(port=0):
+    """Starts the fixture site on a background thread. Returns (server, base_url)."""
+    server = ThreadingHTTPServer(("127.0.0.1", port), FixtureHandler)
+    server.bytes_served = 0
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}"
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Local Instagram post stand-in")
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+    server, base = start_fixture_server(args.port)
+    print(f"🧪 Fixture site on {base}/p/demo/?n=300  (Ctrl+C to stop)")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
@@ -0,0 +1,184 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Command Line)                            |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+#
+#  Usage:  python -m instaguard scan --in comments.jsonl --out findings.jsonl
+#          cat dump.jsonl | python -m instaguard scan --format jsonl > hits.jsonl
+
+import argparse
+import contextlib
+import itertools
+import json
+import os
+import sys
+import time
+
+from comment_stream import iter_comments, iter_records
+
+ID_FIELDS = ["id", "pk", "comment_id"]
+
+
+def _load_analyzer(ml_model_path=None, policy=None):
+    # Analyzer banners go to stderr so stdout stays clean JSONL
+    from analyzer import HybridAnalyzer
+    with contextlib.redirect_stdout(sys.stderr):
+        return HybridAnalyzer(ml_model_path=ml_model_path, policy=policy)
+
+
+def _open_out(path):
+    if path == "-":
+        return sys.stdout, False
+    return open(path, "w", encoding="utf-8"), True
+
+
+# ---------------------------------------------------------
+# scan: stream an export through the analyzer
+# ---------------------------------------------------------
+def _input_records(args):
+    """iter_records(), with an unusable input (no comment column) ending the command like an argument error"""
+    try:
+        yield from iter_records(args.input, field=args.field, fmt=args.format)
+    except ValueError as e:
+        sys.exit(str(e))
+
+
+def cmd_scan(args):
+    records, for_scan = itertools.tee(_input_records(args))
+    texts = (text for _, text in for_scan)
+
+    analyzer = None
+    if args.workers > 1:
+        if args.ml:
+            sys.exit("❌ --ml runs in a single process, drop --workers")
+        from parallel_scan import scan_parallel
+        results = scan_parallel(texts, workers=args.workers, chunksize=args.batch_size, factory=_load_analyzer)
+    else:
+        from cascade import CascadePolicy
+        policy = CascadePolicy(args.cascade, ml_threshold=args.ml_threshold)
+        analyzer = _load_analyzer(args.ml, policy)
+        results = analyzer.iter_scan(texts, batch_size=args.batch_size)
+
+    out, owned = _open_out(args.output)
+    scanned = hits = 0
+    start = last_report = time.perf_counter()
+    try:
+        for (record, text), res in zip(records, results):
+            scanned += 1
+            if res["is_toxic"] or args.all:
+                hits += res["is_toxic"]
+                row = {"index": scanned - 1, "text": text, "reason": res["reason"], "score": res["score"]}
+                for key in ID_FIELDS:
+                    if record.get(key) not in (None, ""):
+                        row["id"] = record[key]
+                        break
+                out.write(json.dumps(row, ensure_ascii=False) + "\n")
+
+            now = time.perf_counter()
+            if now - last_report >= args.progress_every:
+                last_report = now
+                out.flush()
+                print(f"⏱️ {scanned:,} scanned | {hits:,} toxic | {scanned / (now - start):,.0f} comments/s", file=sys.stderr)
+    finally:
+        out.flush()
+        if owned:
+            out.close()
+
+    elapsed = max(time.perf_counter() - start, 1e-9)
+    print(f"✅ Done: {scanned:,} scanned, {hits:,} toxic in {elapsed:.1f}s ({scanned / elapsed:,.0f} comments/s)", file=sys.stderr)
+    if analyzer and analyzer.ml_scorer:
+        print(f"📊 Cascade: {json.dumps(analyzer.stats.summary())}", file=sys.stderr)
+
+
+# ---------------------------------------------------------
+# compile-lexicon: rebuild engine/lexicon.pkl from raw_data/*.csv
+# ---------------------------------------------------------
+def cmd_compile_lexicon(args):
+    import analyzer
+    if args.force and os.path.exists(analyzer.LEXICON_ARTIFACT):
+        os.remove(analyzer.LEXICON_ARTIFACT)
+    start = time.perf_counter()
+    engine = _load_analyzer()
+    size = os.path.getsize(analyzer.LEXICON_ARTIFACT) if os.path.exists(analyzer.LEXICON_ARTIFACT) else 0
+    print(f"📦 {analyzer.LEXICON_ARTIFACT}: {len(engine.loose_phrases)} loose / {len(engine.strict_phrases)} strict, "
+          f"{size / 1024:.0f} KiB, ready in {(time.perf_counter() - start) * 1000:.0f} ms", file=sys.stderr)
+
+
+# ---------------------------------------------------------
+# export-model: int8 CPU build of engine/model_v1
+# ---------------------------------------------------------
+def cmd_export_model(args):
+    from ml_scorer import export_quantized, verify_export
+
+    export_quantized(args.model, args.out, args.format)
+    if args.verify:
+        texts = list(itertools.islice(iter_comments(args.verify_data), args.verify_samples))
+        report = verify_export(texts, args.model, args.out)
+        print(f"🔬 Parity vs fp32: {json.dumps(report)}", file=sys.stderr)
+        if report["max_abs_diff"] > args.tolerance:
+            sys.exit(f"❌ int8 model drifts more than {args.tolerance} from fp32")
+
+
+# ---------------------------------------------------------
+# evidence-gc: prune the content-addressed evidence store
+# ---------------------------------------------------------
+def cmd_evidence_gc(args):
+    from evidence import EvidenceStore
+
+    stats = EvidenceStore(args.root).gc(args.days, dry_run=args.dry_run)
+    verb = "Would remove" if args.dry_run else "Removed"
+    print(f"🧹 {verb} {stats['entries']} index entries and {stats['blobs']} blobs "
+          f"({stats['bytes'] / 1e6:.1f} MB) from {args.root}", file=sys.stderr)
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(prog="instaguard", description="InstaGuard headless tools")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    p = sub.add_parser("scan", help="scan a CSV/JSONL/text export and write toxic hits as JSONL")
+    p.add_argument("--in", dest="input", default="-", help="input file, '-' for stdin (default)")
+    p.add_argument("--out", dest="output", default="-", help="output JSONL, '-' for stdout (default)")
+    p.add_argument("--format", choices=["csv", "jsonl", "txt"], help="input format (default: from extension, stdin is txt)")
+    p.add_argument("--field", help="column/key holding the comment text (default: auto-detect)")
+    p.add_argument("--workers", type=int, default=1, help="processes to use (see parallel_scan)")
+    p.add_argument("--batch-size", type=int, default=2048)
+    p.add_argument("--all", action="store_true", help="write every comment, not only toxic ones")
+    p.add_argument("--progress-every", type=float, default=5.0, help="seconds between throughput reports")
+    p.add_argument("--ml", nargs="?", const="engine/model_v1", help="enable the DistilBERT tier (model dir)")
+    p.add_argument("--cascade", choices=["misses", "borderline", "all", "off"], default="misses",
+                   help="which comments reach the ML tier (see cascade.CascadePolicy)")
+    p.add_argument("--ml-threshold", type=float, default=0.7)
+    p.set_defaults(func=cmd_scan)
+
+    p = sub.add_parser("compile-lexicon", help="compile raw_data CSVs into the cached lexicon artifact")
+    p.add_argument("--force", action="store_true", help="recompile even if the sources are unchanged")
+    p.set_defaults(func=cmd_compile_lexicon)
+
+    p = sub.add_parser("export-model", help="export a dynamically int8-quantized model for CPU inference")
+    p.add_argument("--format", choices=["torch-int8", "onnx"], default="onnx")
+    p.add_argument("--model", default="engine/model_v1", help="fp32 model dir")
+    p.add_argument("--out", default="engine/model_v1_int8", help="export dir (picked up automatically on CPU)")
+    p.add_argument("--verify", action="store_true", help="compare against the fp32 model after export")
+    p.add_argument("--verify-data", default="data/training_data.csv")
+    p.add_argument("--verify-samples", type=int, default=500)
+    p.add_argument("--tolerance", type=float, default=0.05, help="max allowed probability difference")
+    p.set_defaults(func=cmd_export_model)
+
+    p = sub.add_parser("evidence-gc", help="drop old evidence entries and unreferenced screenshot blobs")
+    p.add_argument("--root", default="evidence", help="evidence store directory")
+    p.add_argument("--days", type=float, help="drop entries not seen for this many days (default: keep all)")
+    p.add_argument("--dry-run", action="store_true", help="report what would be removed")
+    p.set_defaults(func=cmd_evidence_gc)
+
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    args.func(args)
+
+
+if __name__ == "__main__":
+    main()
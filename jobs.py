@@ -0,0 +1,122 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Job Manager)                             |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+
+import itertools
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+
+
+class ScanJob:
+    """One background scan. Readers get copies via snapshot(); the worker writes through the hooks."""
+
+    def __init__(self, job_id, label):
+        self.id = job_id
+        self.label = label
+        self.status = "queued"  # queued -> running -> done | failed | cancelled
+        self.progress = {}
+        self.findings = []
+        self.error = None
+        self.created = time.time()
+        self.started = None
+        self.finished = None
+        self.future = None
+        self._lock = threading.Lock()
+
+    # Hooks handed to the scraper (worker thread)
+    def add_finding(self, finding):
+        with self._lock:
+            self.findings.append(finding)
+
+    def set_progress(self, progress):
+        with self._lock:
+            self.progress = dict(progress)
+
+    @property
+    def active(self):
+        return self.status in ("queued", "running")
+
+    def snapshot(self, since=0):
+        """Status plus the findings from index `since` on, safe to read from any thread"""
+        with self._lock:
+            return {
+                "id": self.id,
+                "label": self.label,
+                "status": self.status,
+                "progress": dict(self.progress),
+                "found": len(self.findings),
+                "findings": list(self.findings[since:]),
+                "error": self.error,
+                "seconds": round((self.finished or time.time()) - (self.started or time.time()), 1),
+            }
+
+
+class JobManager:
+    """
+    Runs scans on a thread pool so the dashboard never blocks on a scrape.
+    Up to `max_workers` jobs run at once, the rest wait in order.
+    A job is any callable taking on_finding= and on_progress= keywords.
+    """
+
+    def __init__(self, max_workers=2, keep=50):
+        self.keep = keep  # finished jobs remembered
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="scan-job")
+        self._jobs = {}
+        self._ids = itertools.count(1)
+        self._lock = threading.Lock()
+
+    def submit(self, label, fn, *args, **kwargs):
+        """Queues fn(*args, on_finding=..., on_progress=..., **kwargs). Returns the job id."""
+        with self._lock:
+            job = ScanJob(f"job-{next(self._ids)}", label)
+            self._jobs[job.id] = job
+            self._prune()
+        job.future = self._executor.submit(self._run, job, fn, args, kwargs)
+        return job.id
+
+    def _run(self, job, fn, args, kwargs):
+        job.status = "running"
+        job.started = time.time()
+        try:
+            result = fn(*args, on_finding=job.add_finding, on_progress=job.set_progress, **kwargs)
+            with job._lock:
+                # The returned list is authoritative (e.g. evidence paths flushed to disk)
+                if result is not None:
+                    job.findings = list(result)
+            job.status = "done"
+        except Exception as e:
+            job.error = f"{type(e).__name__}: {e}"
+            job.status = "failed"
+            traceback.print_exc()
+        finally:
+            job.finished = time.time()
+
+    def get(self, job_id):
+        return self._jobs.get(job_id)
+
+    def jobs(self):
+        """Newest first"""
+        with self._lock:
+            return sorted(self._jobs.values(), key=lambda j: j.created, reverse=True)
+
+    def cancel(self, job_id):
+        """Cancels a job that has not started yet. Returns True on success."""
+        job = self._jobs.get(job_id)
+        if job and job.future and job.future.cancel():
+            job.status = "cancelled"
+            job.finished = time.time()
+            return True
+        return False
+
+    def _prune(self):
+        finished = [j for j in sorted(self._jobs.values(), key=lambda j: j.created) if not j.active]
+        for job in finished[:max(0, len(finished) - self.keep)]:
+            del self._jobs[job.id]
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -11,6 +11,8 @@ import asyncio
 import sys
 import os
 import json
+import math
+import time
 
 if sys.platform == 'win32':
     asyncio.set_event_loop_policy(asyncio.WindowsProactorEventLoopPolicy())
@@ -21,6 +23,10 @@ import streamlit.components.v1 as components
 # Import Actual Modules
 from analyzer import HybridAnalyzer
 from scraper import EnterpriseScraper
+from browser_pool import BrowserPool
+from jobs import JobManager
+from evidence_server import evidence_urls, start_evidence_server
+from findings_db import FindingsDB
 
 # -----------------------------------
 # Page Configuration
@@ -130,6 +136,28 @@ st.markdown("""
 def load_engine():
     return HybridAnalyzer()
 
+@st.cache_resource(validate=lambda pool: pool.alive)
+def load_browser_pool(headless=False):
+    # Lives as long as the app process: browser launch + session restore happen once
+    # (a pool whose playwright failed to start is replaced on the next scan)
+    return BrowserPool(EnterpriseScraper(headless=headless))
+
+@st.cache_resource
+def load_evidence_server():
+    # Thumbnails + full images over HTTP with cache headers; the iframe can't read local paths
+    server, base_url = start_evidence_server("evidence")
+    return base_url
+
+@st.cache_resource
+def load_findings_db():
+    # Same file the scrapers write to; survives refreshes and restarts
+    return FindingsDB(os.path.join("evidence", "findings.sqlite3"))
+
+@st.cache_resource
+def load_job_manager():
+    # Scans run here, off the script thread: the UI stays live and several can be queued
+    return JobManager(max_workers=3)
+
 try:
     engine = load_engine()
 except Exception as e:
@@ -146,6 +174,15 @@ with st.sidebar:
     
     url = st.text_input("Target URL", placeholder="https://instagram.com/p/...", value="https://www.instagram.com/p/C-demo/")
     limit = st.number_input("Scan Limit", 10, 500, 50)
+    backend = st.selectbox("Extraction Backend", ["Browser (Playwright)", "Private API (instagrapi)"],
+                           help="The API backend needs a 'sessionid' cookie in cookies.json and captures no screenshots.")
+    headless = st.checkbox("Headless Fast Mode", value=False,
+                           help="No visible window; images, video, fonts and trackers are blocked except for evidence.")
+    evidence_format = st.selectbox("Evidence Format", ["png", "webp", "jpeg"],
+                                   help="Screenshot of each flagged comment; webp/jpeg are much smaller.")
+    incremental = st.checkbox("Incremental Re-scan", value=True,
+                              help="Resume from the post's last checkpoint and stop at comments already processed. "
+                                   "A lexicon or model change always triggers a full re-scan.")
     
     st.markdown("<br>", unsafe_allow_html=True)
     run_button = st.button("Start Mobile Extraction", type="primary")
@@ -154,56 +191,36 @@ with st.sidebar:
     st.caption("Environment: iPhone 13 Pro (Emu)\nClearance: Cyber Cell L1")
 
 # -----------------------------------
-# Execution Logic
+# Results Rendering (one page at a time)
 # -----------------------------------
-
-if 'data' not in st.session_state:
-    st.session_state.data = None
-    st.session_state.logs = []
-
-if run_button:
-    if not url:
-        st.warning("Please enter a target URL.")
-    else:
-        # Generate Fake Logs for UI Effect
-        logs = [
-            "Initializing iOS Environment...",
-            "Loading iPhone 13 Pro Emulator image...",
-            f"Connecting to Target: {url[:30]}...",
-            f"Configuring scroll depth: {limit} items",
-            "Simulating Touch Gestures & Swipe...",
-            "Decrypting comment payloads...",
-            "Cross-referencing with Threat Database...",
-            "Analysis complete. Rendering evidence."
-        ]
-        
-        # Run Real Scraper
-        bot = EnterpriseScraper()
-        
-        # We run the scraper first, then show the UI
-        with st.spinner("Extracting Data..."):
-            scraped_data = bot.run(url, limit, engine)
-        
-        st.session_state.data = scraped_data
-        st.session_state.logs = logs
-        st.rerun()
-
-# -----------------------------------
-# Results Dashboard (Logic A + Design B)
-# -----------------------------------
-
-# -----------------------------------
-# Results Dashboard (Double Brace Method)
-# -----------------------------------
-
-if st.session_state.data is not None:
-    # 1. Prepare Data
-    json_logs = json.dumps(st.session_state.logs)
-    json_data = json.dumps(st.session_state.data)
-    
-    # 2. HTML Injection using f-string
+RESULTS_PAGE_SIZE = 24
+ALL_POSTS = "All posts"
+ALL_REASONS = "All reasons"
+
+def turn_page(step):
+    st.session_state.results_page += step
+
+def reset_results_page():
+    st.session_state.results_page = 0
+
+def with_evidence_urls(page):
+    """Swaps each finding's local image path for thumb/full URLs on the evidence server"""
+    base_url = load_evidence_server()
+    out = []
+    for finding in page:
+        item = {k: v for k, v in finding.items() if k != "image"}
+        item.update(evidence_urls(finding.get("image"), base_url) or {})
+        out.append(item)
+    return out
+
+def build_dashboard_html(page, offset, total, logs, animate=True):
+    """Results grid for one page of findings; only that page is serialized into the iframe"""
+    json_logs = json.dumps(logs)
+    json_data = json.dumps(with_evidence_urls(page))
+
+    # HTML Injection using f-string
     # NOTICE: We use {{ }} for CSS/JS, and { } ONLY for python variables
-    dashboard_html = f"""
+    return f"""
     <div style="font-family: 'Inter', sans-serif; color: #e2e8f0; padding: 0 1rem;">
         
         <div style="background: #0b1121; border: 1px solid #1e293b; border-radius: 8px; padding: 1rem; height: 160px; overflow: hidden; position: relative; font-family: 'JetBrains Mono', monospace; font-size: 0.85rem; margin-bottom: 2rem; box-shadow: inset 0 0 20px rgba(0,0,0,0.5);">
@@ -220,7 +237,7 @@ if st.session_state.data is not None:
                 <span style="color: #ef4444;">●</span> Analysis Results
             </h3>
             <div style="font-size: 0.9rem; color: #94a3b8;">
-                Threats Found: <span style="color: #ef4444; font-weight: 700;">{len(st.session_state.data)}</span>
+                Threats Found: <span style="color: #ef4444; font-weight: 700;">{total}</span>
             </div>
         </div>
 
@@ -256,6 +273,7 @@ if st.session_state.data is not None:
         // JS: SINGLE BRACES for Python Variables, DOUBLE for JS blocks
         const logs = {json_logs};
         const threats = {json_data};
+        const offset = {offset}, animate = {json.dumps(animate)};
 
         const term = document.getElementById('terminal-content');
         let i = 0;
@@ -271,7 +289,7 @@ if st.session_state.data is not None:
                 term.appendChild(div);
                 term.scrollTop = term.scrollHeight;
                 i++;
-                setTimeout(typeLog, 300);
+                setTimeout(typeLog, animate ? 300 : 0);
             }} else {{
                 renderGrid();
             }}
@@ -284,19 +302,21 @@ if st.session_state.data is not None:
                 card.className = 'card';
                 card.style.opacity = '0';
                 card.style.animation = 'fadeIn 0.5s forwards';
-                card.style.animationDelay = (idx * 0.1) + 's';
+                // Capped stagger: a full page is on screen within a second
+                card.style.animationDelay = animate ? Math.min(idx * 0.04, 0.8) + 's' : '0s';
                 
-                // Safe Image handling
-                const imgSrc = t.image ? t.image : 'https://via.placeholder.com/300x400/000000/FFFFFF?text=Evidence';
+                // Safe Image handling: small WebP thumbnail, full capture only when clicked
+                const imgSrc = t.thumb ? t.thumb : 'https://via.placeholder.com/300x400/000000/FFFFFF?text=Evidence';
+                const fullHref = t.full ? t.full : t.link;
                 
                 card.innerHTML = `
                     <div class="card-header">
-                        <span>ID: #${{1000 + idx}}</span>
+                        <span>ID: #${{1000 + offset + idx}}</span>
                         <span class="badge">THREAT DETECTED</span>
                     </div>
                     <div class="card-body">
                         <div class="mockup">
-                            <img src="${{imgSrc}}" onerror="this.src='https://via.placeholder.com/300x400/000000/FFFFFF?text=Evidence'" alt="Evidence">
+                            <a href="${{fullHref}}" target="_blank"><img src="${{imgSrc}}" loading="lazy" onerror="this.src='https://via.placeholder.com/300x400/000000/FFFFFF?text=Evidence'" alt="Evidence"></a>
                         </div>
                         <div class="threat-text">"${{t.text.replace(/"/g, '&quot;')}}"</div>
                         <div style="font-size:0.7rem; color:#64748b; margin-bottom:4px;">TRIGGER LOGIC:</div>
@@ -311,11 +331,146 @@ if st.session_state.data is not None:
             }});
         }}
 
-        setTimeout(typeLog, 500);
+        setTimeout(typeLog, animate ? 500 : 0);
     </script>
     """
-    
-    components.html(dashboard_html, height=900, scrolling=True)
+
+
+# -----------------------------------
+# Execution Logic
+# -----------------------------------
+
+if 'results_page' not in st.session_state:
+    st.session_state.focus_post = None
+    st.session_state.logs = []
+    st.session_state.active_job = None
+    st.session_state.shown_job = None
+    st.session_state.animated_job = None
+    st.session_state.results_page = 0
+
+jobs = load_job_manager()
+
+if run_button:
+    if not url:
+        st.warning("Please enter a target URL.")
+    else:
+        # Generate Fake Logs for UI Effect
+        logs = [
+            "Initializing iOS Environment...",
+            "Loading iPhone 13 Pro Emulator image...",
+            f"Connecting to Target: {url[:30]}...",
+            f"Configuring scroll depth: {limit} items",
+            "Simulating Touch Gestures & Swipe...",
+            "Decrypting comment payloads...",
+            "Cross-referencing with Threat Database...",
+            "Analysis complete. Rendering evidence."
+        ]
+        
+        # Run Real Scraper as a background job (the browser backend reuses the app-wide warm browser)
+        if backend.startswith("Private API"):
+            from api_scraper import APIScraper
+            job_id = jobs.submit(url, APIScraper(incremental=incremental).run, url, limit, engine)
+        else:
+            bot = EnterpriseScraper(headless=headless, evidence_format=evidence_format, incremental=incremental)
+            job_id = jobs.submit(url, load_browser_pool(headless).scan, url, limit, engine, scraper=bot)
+
+        st.session_state.active_job = job_id
+        st.session_state.logs = logs
+
+# -----------------------------------
+# Live Job Panel (polls only while something is queued or running)
+# -----------------------------------
+polling = any(job.active for job in jobs.jobs())
+
+@st.fragment(run_every=1.0 if polling else None)
+def job_panel():
+    recent = jobs.jobs()[:5]
+    if not recent:
+        return
+
+    st.markdown("#### 🛰️ Scan Jobs")
+    for job in recent:
+        snap = job.snapshot(since=len(job.findings))
+        progress = snap["progress"]
+        status = {"queued": "⏳", "running": "🔄", "done": "✅", "failed": "❌", "cancelled": "🚫"}[snap["status"]]
+        cols = st.columns([6, 1])
+        cols[0].caption(f"{status} {snap['id']} · {snap['label'][:50]} · {progress.get('comments', 0)} comments · "
+                        f"{snap['found']} threats · {snap['seconds']}s" + (f" · {snap['error']}" if snap["error"] else ""))
+        if snap["status"] == "queued" and cols[1].button("Cancel", key=f"cancel-{snap['id']}"):
+            jobs.cancel(snap["id"])
+
+    job = jobs.get(st.session_state.active_job)
+    if job is None:
+        return
+    if job.active:
+        # Newest page of partial findings: the payload stays one page however many arrive
+        total = len(job.findings)
+        offset = max(0, total - RESULTS_PAGE_SIZE)
+        snap = job.snapshot(since=offset)
+        if snap["findings"]:
+            components.html(build_dashboard_html(snap["findings"], offset, snap["found"], [], animate=False),
+                            height=600, scrolling=True)
+    elif st.session_state.shown_job != job.id:
+        # Finished: the findings are in the database, point the dashboard below at this post
+        st.session_state.focus_post = job.label
+        st.session_state.shown_job = job.id
+        st.session_state.results_page = 0
+        st.rerun()
+
+job_panel()
+
+# -----------------------------------
+# Results Dashboard (Logic A + Design B)
+# -----------------------------------
+
+# -----------------------------------
+# Results Dashboard (Double Brace Method)
+# -----------------------------------
+
+findings_db = load_findings_db()
+
+if findings_db.count():
+    # Filters and paging run in SQLite: only the rows of the visible page are read
+    posts = findings_db.posts()
+    if st.session_state.focus_post in posts:
+        st.session_state.results_post = st.session_state.focus_post
+        st.session_state.results_reason = ALL_REASONS
+    st.session_state.focus_post = None
+
+    filters = st.columns([3, 2, 1])
+    post = filters[0].selectbox("Post", [ALL_POSTS] + posts, key="results_post", on_change=reset_results_page)
+    reason = filters[1].selectbox("Reason", [ALL_REASONS] + findings_db.reasons(), key="results_reason",
+                                  on_change=reset_results_page)
+    days = filters[2].number_input("Last N days (0 = all)", 0, 3650, 0, key="results_days",
+                                   on_change=reset_results_page)
+    query = {
+        "post_url": None if post == ALL_POSTS else post,
+        "reason": None if reason == ALL_REASONS else reason,
+        "since": time.time() - days * 86400 if days else None,
+    }
+
+    total = findings_db.count(**query)
+    pages = max(1, math.ceil(total / RESULTS_PAGE_SIZE))
+    page_no = min(st.session_state.results_page, pages - 1)
+
+    if pages > 1:
+        nav = st.columns([1, 3, 1])
+        nav[0].button("← Prev", disabled=page_no == 0, on_click=turn_page, args=(-1,))
+        nav[1].markdown(f"<div style='text-align:center; color:#94a3b8;'>Page {page_no + 1} of {pages} "
+                        f"· {total} threats</div>", unsafe_allow_html=True)
+        nav[2].button("Next →", disabled=page_no >= pages - 1, on_click=turn_page, args=(1,))
+
+    # Terminal intro only the first time a result set is shown
+    animate = st.session_state.animated_job != st.session_state.shown_job
+    st.session_state.animated_job = st.session_state.shown_job
+
+    start = page_no * RESULTS_PAGE_SIZE
+    if total:
+        page = findings_db.query(**query, limit=RESULTS_PAGE_SIZE, offset=start)
+        components.html(build_dashboard_html(page, start, total, st.session_state.logs, animate),
+                        height=900, scrolling=True)
+    else:
+        st.info("No findings match these filters.")
 
 else:
     # Empty State
@@ -0,0 +1,91 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Matcher Module)                          |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+
+from collections import deque
+
+
+def _is_word(ch):
+    """Same notion of a 'word' character as the regex \\w class."""
+    return ch.isalnum() or ch == "_"
+
+
+class PhraseMatcher:
+    """
+    Aho-Corasick automaton built once over a fixed set of phrases.
+    One left-to-right pass over the text finds every phrase, so scan time
+    depends on the comment length and not on the size of the lexicon.
+
+    word_boundary=True mirrors the old r'\\b(...)\\b' regex:
+    "kill" matches "i will kill you" but not "skill".
+    """
+
+    def __init__(self, phrases, word_boundary=False):
+        self.word_boundary = word_boundary
+        self.phrases = sorted({p for p in phrases if p}, key=lambda p: (-len(p), p))
+        self._build()
+
+    def __len__(self):
+        return len(self.phrases)
+
+    def _build(self):
+        # 1. Trie of all phrases
+        goto = [{}]
+        out = [()]
+        for phrase in self.phrases:
+            state = 0
+            for ch in phrase:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append(())
+                state = nxt
+            out[state] = (phrase,)
+
+        # 2. Failure links (breadth-first, so shorter suffixes are ready first)
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                # Own phrase first, then shorter suffix phrases (longest-first)
+                out[nxt] = out[nxt] + out[fail[nxt]]
+
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def _bounded(self, text, start, end):
+        before = start > 0 and _is_word(text[start - 1])
+        after = end < len(text) and _is_word(text[end])
+        return (before != _is_word(text[start])) and (_is_word(text[end - 1]) != after)
+
+    def finditer(self, text):
+        """Yields (start, phrase) for every hit, in order of where it ends."""
+        goto, fail, out = self._goto, self._fail, self._out
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            for phrase in out[state]:
+                start = i + 1 - len(phrase)
+                if self.word_boundary and not self._bounded(text, start, i + 1):
+                    continue
+                yield start, phrase
+
+    def search(self, text):
+        """Returns the first phrase found in text, or None."""
+        for _, phrase in self.finditer(text):
+            return phrase
+        return None
@@ -0,0 +1,206 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (ML Scoring Module)                       |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+
+import json
+import os
+
+MODEL_PATH = os.path.join("engine", "model_v1")
+QUANTIZED_PATH = os.path.join("engine", "model_v1_int8")
+MAX_LENGTH = 32  # Same cap as train_engine.py
+
+# Files written by export_quantized(), per format
+EXPORT_FILES = {"torch-int8": "model_int8.pt", "onnx": "model.int8.onnx"}
+EXPORT_META = "export.json"
+
+
+def exported_backend(path=QUANTIZED_PATH, source=None):
+    """
+    Format of the quantized export in path ('torch-int8' / 'onnx'), or None.
+    With source, only an export made from that model directory counts.
+    """
+    meta = os.path.join(path, EXPORT_META)
+    if not os.path.exists(meta):
+        return None
+    with open(meta, "r") as f:
+        meta = json.load(f)
+    exported_from = meta.get("source")
+    if source is not None and (not exported_from or os.path.realpath(exported_from) != os.path.realpath(source)):
+        print(f"⚠️ Int8 export in {path} was made from {exported_from}, not {source}: using fp32.")
+        return None
+    return meta.get("format")
+
+
+class TransformerScorer:
+    """
+    Batched DistilBERT scoring for engine/model_v1.
+    torch / transformers are imported on construction, never at module import.
+
+    backend:
+      "auto"       - fp32 on CUDA; on CPU the int8 export of model_path if one exists, else fp32
+      "fp32"       - the trained model as saved by train_engine.py
+      "torch-int8" - dynamically quantized torch model (export_quantized)
+      "onnx"       - int8 ONNX model run with onnxruntime (export_quantized)
+    """
+
+    def __init__(self, model_path=MODEL_PATH, device=None, batch_size=32, max_length=MAX_LENGTH,
+                 backend="auto", quantized_path=QUANTIZED_PATH):
+        import torch
+        from transformers import DistilBertTokenizerFast
+
+        self.torch = torch
+        self.batch_size = batch_size
+        self.max_length = max_length
+        self.device = device or ("cuda" if torch.cuda.is_available() else "cpu")
+
+        if backend == "auto":
+            backend = "fp32"
+            if self.device == "cpu":
+                backend = exported_backend(quantized_path, source=model_path) or "fp32"
+        self.backend = backend
+
+        if backend == "fp32":
+            from transformers import DistilBertForSequenceClassification
+            self.tokenizer = DistilBertTokenizerFast.from_pretrained(model_path)
+            self.model = DistilBertForSequenceClassification.from_pretrained(model_path)
+            self.model.eval()
+            self.model.to(self.device)
+            source = model_path
+        else:
+            # Quantized exports are CPU-only
+            self.device = "cpu"
+            self.tokenizer = DistilBertTokenizerFast.from_pretrained(quantized_path)
+            source = os.path.join(quantized_path, EXPORT_FILES[backend])
+            if backend == "torch-int8":
+                self.model = torch.load(source, weights_only=False)
+                self.model.eval()
+            else:
+                import onnxruntime as ort
+                self.session = ort.InferenceSession(source, providers=["CPUExecutionProvider"])
+
+        print(f"🧠 ML engine loaded from {source} on {self.device} ({self.backend})")
+
+    def _forward(self, batch):
+        """Toxic probability for one padded batch"""
+        if self.backend == "onnx":
+            import numpy as np
+            logits = self.session.run(None, {
+                "input_ids": batch["input_ids"].astype(np.int64),
+                "attention_mask": batch["attention_mask"].astype(np.int64),
+            })[0]
+            exp = np.exp(logits - logits.max(axis=1, keepdims=True))
+            return (exp[:, 1] / exp.sum(axis=1)).tolist()
+
+        batch = {k: v.to(self.device) for k, v in batch.items()}
+        logits = self.model(**batch).logits
+        return self.torch.softmax(logits, dim=1)[:, 1].tolist()
+
+    def score_many(self, texts):
+        """
+        Toxic probability for every text, in input order.
+        Texts are tokenized once, sorted by token length and cut into
+        micro-batches, each padded only to its own longest member.
+        """
+        texts = [t or "" for t in texts]
+        if not texts:
+            return []
+
+        enc = self.tokenizer(texts, truncation=True, max_length=self.max_length)
+        ids, masks = enc["input_ids"], enc["attention_mask"]
+
+        # Length bucketing: neighbours have similar lengths, so little padding
+        order = sorted(range(len(texts)), key=lambda i: len(ids[i]))
+        probs = [0.0] * len(texts)
+        tensors = "np" if self.backend == "onnx" else "pt"
+
+        with self.torch.inference_mode():
+            for start in range(0, len(order), self.batch_size):
+                idx = order[start:start + self.batch_size]
+                batch = self.tokenizer.pad(
+                    {"input_ids": [ids[i] for i in idx], "attention_mask": [masks[i] for i in idx]},
+                    padding="longest",
+                    return_tensors=tensors,
+                )
+                for i, p in zip(idx, self._forward(batch)):
+                    probs[i] = p
+
+        return probs
+
+    def score(self, text):
+        return self.score_many([text])[0]
+
+
+# ---------------------------------------------------------
+# CPU export: dynamic int8 quantization
+# ---------------------------------------------------------
+def export_quantized(model_path=MODEL_PATH, out_dir=QUANTIZED_PATH, fmt="torch-int8"):
+    """
+    Writes a dynamically int8-quantized copy of the fp32 model to out_dir.
+    "torch-int8" quantizes the Linear layers with torch; "onnx" exports the
+    graph and quantizes it with onnxruntime. The tokenizer is copied alongside.
+    """
+    import torch
+    from transformers import DistilBertTokenizerFast, DistilBertForSequenceClassification
+
+    os.makedirs(out_dir, exist_ok=True)
+    tokenizer = DistilBertTokenizerFast.from_pretrained(model_path)
+    model = DistilBertForSequenceClassification.from_pretrained(model_path).eval()
+    target = os.path.join(out_dir, EXPORT_FILES[fmt])
+
+    if fmt == "torch-int8":
+        qmodel = torch.ao.quantization.quantize_dynamic(model, {torch.nn.Linear}, dtype=torch.qint8)
+        torch.save(qmodel, target)
+
+    elif fmt == "onnx":
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+
+        fp32_path = os.path.join(out_dir, "model.onnx")
+        sample = tokenizer(["export sample"], return_tensors="pt", padding="max_length", max_length=MAX_LENGTH)
+        model.config.return_dict = False
+        torch.onnx.export(
+            model,
+            (sample["input_ids"], sample["attention_mask"]),
+            fp32_path,
+            input_names=["input_ids", "attention_mask"],
+            output_names=["logits"],
+            dynamic_axes={
+                "input_ids": {0: "batch", 1: "seq"},
+                "attention_mask": {0: "batch", 1: "seq"},
+                "logits": {0: "batch"},
+            },
+            opset_version=17,
+            dynamo=False,
+        )
+        quantize_dynamic(fp32_path, target, weight_type=QuantType.QInt8)
+        os.remove(fp32_path)
+
+    else:
+        raise ValueError(f"❌ Unknown export format '{fmt}', expected one of {list(EXPORT_FILES)}")
+
+    tokenizer.save_pretrained(out_dir)
+    with open(os.path.join(out_dir, EXPORT_META), "w") as f:
+        json.dump({"format": fmt, "source": model_path, "max_length": MAX_LENGTH}, f, indent=2)
+
+    print(f"📦 Exported {fmt} model to {target} ({os.path.getsize(target) / 1e6:.1f} MB)")
+    return target
+
+
+def verify_export(texts, model_path=MODEL_PATH, out_dir=QUANTIZED_PATH, threshold=0.7):
+    """
+    Parity check of the int8 export against the fp32 model on CPU.
+    Returns max/mean absolute probability difference and verdict agreement.
+    """
+    fp32 = TransformerScorer(model_path, device="cpu", backend="fp32")
+    quant = TransformerScorer(model_path, device="cpu", backend=exported_backend(out_dir), quantized_path=out_dir)
+    a, b = fp32.score_many(texts), quant.score_many(texts)
+    diffs = [abs(x - y) for x, y in zip(a, b)]
+    return {
+        "backend": quant.backend,
+        "samples": len(texts),
+        "max_abs_diff": round(max(diffs), 4) if diffs else 0.0,
+        "mean_abs_diff": round(sum(diffs) / len(diffs), 4) if diffs else 0.0,
+        "agreement": round(sum((x > threshold) == (y > threshold) for x, y in zip(a, b)) / len(a), 4) if a else 1.0,
+    }
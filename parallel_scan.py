@@ -0,0 +1,72 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Parallel Scan Module)                    |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+
+import multiprocessing as mp
+import os
+from collections import deque
+
+from analyzer import HybridAnalyzer
+
+# One analyzer per worker process (inherited from the parent on fork)
+_worker_analyzer = None
+
+
+def _init_worker(factory):
+    global _worker_analyzer
+    if _worker_analyzer is None:
+        _worker_analyzer = factory()
+
+
+def _scan_chunk(chunk):
+    return _worker_analyzer.scan_many(chunk)
+
+
+def _chunks(iterable, size):
+    chunk = []
+    for item in iterable:
+        chunk.append(item)
+        if len(chunk) >= size:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def scan_parallel(iterable, workers=None, chunksize=1000, max_pending=None, factory=HybridAnalyzer):
+    """
+    Scans comments on every core and yields results in input order.
+
+    The input is read lazily: at most max_pending chunks (default 2 per worker)
+    are in flight, so memory stays bounded even on multi-GB dumps.
+    On fork platforms the analyzer is built in the parent for the lifetime of
+    the pool and shared copy-on-write; elsewhere each worker builds its own
+    in the initializer. Every call uses its own factory.
+    """
+    global _worker_analyzer
+    workers = workers or os.cpu_count() or 1
+    max_pending = max_pending or workers * 2
+
+    previous = _worker_analyzer
+    if "fork" in mp.get_all_start_methods():
+        ctx = mp.get_context("fork")
+        _worker_analyzer = factory()
+    else:
+        ctx = mp.get_context("spawn")
+
+    try:
+        with ctx.Pool(workers, initializer=_init_worker, initargs=(factory,)) as pool:
+            pending = deque()
+            for chunk in _chunks(iterable, chunksize):
+                pending.append(pool.apply_async(_scan_chunk, (chunk,)))
+                # Back-pressure: wait for the oldest chunk before reading more input
+                if len(pending) >= max_pending:
+                    yield from pending.popleft().get()
+            while pending:
+                yield from pending.popleft().get()
+    finally:
+        # The parent does not keep this analyzer, and the next call does not inherit it
+        _worker_analyzer = previous
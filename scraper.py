@@ -457,39 +457,290 @@ class EnterpriseScraper:
 
 
 
-from playwright.sync_api import sync_playwright
 import time
 import os
 import json
 import re
 from datetime import datetime
 
+from comment_capture import CommentCapture
+from evidence import HIGHLIGHT_CSS, EvidenceStore, EvidenceWriter, comment_key
+from findings_db import FindingsDB, comment_epoch
+from seen_set import SeenHashes, load_seen_set, make_seen_set, seen_key
+
+# Shared with async_scraper.py
+DEVICE_NAME = 'iPhone 13 Pro'
+COMMENT_SELECTOR = "ul > li, div[role='button']"
+
+# Resolves as soon as more than n comment nodes exist (or after ms, as a fallback)
+WAIT_FOR_GROWTH_JS = """
+([sel, n, ms]) => new Promise(resolve => {
+    const count = () => document.querySelectorAll(sel).length;
+    if (count() > n) return resolve(count());
+    const obs = new MutationObserver(() => {
+        if (count() > n) { obs.disconnect(); clearTimeout(timer); resolve(count()); }
+    });
+    const timer = setTimeout(() => { obs.disconnect(); resolve(count()); }, ms);
+    obs.observe(document.body, {childList: true, subtree: true});
+})
+"""
+
+# Headless fast mode: requests never needed for comment text
+BLOCKED_RESOURCE_TYPES = {"image", "media", "font"}
+TRACKER_HINTS = (
+    "google-analytics.com", "googletagmanager.com", "doubleclick.net", "connect.facebook.net",
+    "/logging_client_events", "/ajax/bz", "/ajax/qm", "/falco",
+)
+
+# Image URLs inside a comment node (the only images fetched while blocking)
+NODE_IMAGE_URLS_JS = "node => Array.from(node.querySelectorAll('img')).map(i => i.currentSrc || i.src).filter(Boolean)"
+
+# Re-requests a node's images (they were aborted) and resolves once loaded, or after ms
+RELOAD_NODE_IMAGES_JS = """
+(node, ms) => Promise.all(Array.from(node.querySelectorAll("img")).map(img => new Promise(resolve => {
+    const src = img.currentSrc || img.src;
+    if (!src) return resolve();
+    img.removeAttribute("srcset");
+    img.src = "";
+    const timer = setTimeout(resolve, ms);
+    img.addEventListener("load", () => { clearTimeout(timer); resolve(); }, {once: true});
+    img.addEventListener("error", () => { clearTimeout(timer); resolve(); }, {once: true});
+    img.src = src;
+})))
+"""
+
+# One round trip per pass: tags unseen comment nodes and returns them as records
+EXTRACT_COMMENTS_JS = """
+(sel) => {
+    const nodes = document.querySelectorAll(sel);
+    const items = [];
+    for (const node of nodes) {
+        // Returned before: only again once its text changed ("... more" expanded).
+        // textContent length is the cheap check, it needs no layout like innerText
+        const size = String(node.textContent.length);
+        if (node.dataset.igSeen && node.dataset.igLen === size) continue;
+        const text = node.innerText || "";
+        if (!text.trim()) continue;  // not rendered yet, pick it up next pass
+        const grown = Boolean(node.dataset.igSeen);
+        if (!grown) {
+            window.__igNextId = (window.__igNextId || 0) + 1;
+            node.dataset.igSeen = String(window.__igNextId);
+        }
+        node.dataset.igLen = size;
+        const author = node.querySelector("h3 a, h2 a, a[href^='/']");
+        const time = node.querySelector("time");
+        items.push({
+            id: node.dataset.igSeen,
+            pk: node.dataset.pk || null,
+            text: text,
+            author: author ? author.innerText.trim() : null,
+            timestamp: time ? (time.getAttribute("datetime") || time.innerText) : null,
+            grown: grown
+        });
+    }
+    return {total: nodes.length, items: items};
+}
+"""
+
+
+class PostScan:
+    """
+    Bookkeeping of one post scan, shared by the browser, async and API backends,
+    which only do the page / network I/O. Per pass:
+
+        scan.passes += 1
+        batch = scan.take(network_items, dom_items, network_live)
+        if scan.reached_known(arrived, batch, needed): break
+        for item, text, res in scan.hits(batch):   # analyzed, up to max_limit
+            scan.record(item, text, res, image)
+        scan.end_pass(progress)
+
+    and scan.finish(complete) once at the end. Only the constructor, end_pass()
+    and finish() touch the database, so the async backend runs just those in a thread.
+    """
+
+    def __init__(self, scraper, url, max_limit, analyzer, on_finding=None, on_progress=None):
+        self.scraper = scraper
+        self.url = url
+        self.max_limit = max_limit
+        self.analyzer = analyzer
+        self.on_finding = on_finding
+        self.on_progress = on_progress
+        self.seen, self.since, self.checkpoint = scraper.resume_point(url, analyzer)
+
+        self.findings = []
+        self.unsaved = []  # findings of the current pass, stored in one transaction
+        self.unrecorded = []  # hits left over at the limit, taken back out of the checkpoint
+        self.truncated = False  # the last hits() stopped at the limit with comments left
+        self.passes = 0
+        self.scanned = 0
+        self.skipped = 0
+        self.dom_comments = 0
+        self.newest = None
+        self.known_passes = 0
+        self.reached_end = False
+        self.started = time.perf_counter()
+
+    @property
+    def full(self):
+        return len(self.findings) >= self.max_limit
+
+    def take(self, network_items, dom_items=None, network_live=True):
+        """Comments of this pass that still need analysis: merged, deduplicated, newer than the cut-off"""
+        batch = self.scraper.merge_batch(network_items, dom_items, self.seen, network_live)
+        self.dom_comments += len(batch) - len(network_items)
+        merged = len(batch)
+        batch, newest = self.scraper.split_new(batch, self.since)
+        self.skipped += merged - len(batch)
+        if newest is not None:
+            self.newest = newest if self.newest is None else max(self.newest, newest)
+        self.scanned += len(batch)
+        return batch
+
+    def reached_known(self, arrived, batch, needed):
+        """
+        Counts passes where comments arrived but the last scan had processed all of
+        them. True once `needed` such passes in a row allow stopping (known territory).
+        """
+        if not arrived or batch:
+            self.known_passes = 0
+            return False
+        self.known_passes += 1
+        if self.known_passes >= needed and self.scraper.may_stop_early(self.checkpoint, self.passes):
+            print(f"✅ Reached comments processed by the last scan: {self.url}")
+            self.reached_end = True
+            return True
+        return False
+
+    def hits(self, batch):
+        """Analyzes batch and yields (item, text, result) per toxic comment until the limit is reached"""
+        self.truncated = False
+        results = self.analyzer.scan_many([text for _, text in batch])
+        for i, ((item, text), res) in enumerate(zip(batch, results)):
+            if self.full:
+                self.truncated = True
+                self.unrecorded = [pair for pair, r in zip(batch[i:], results[i:]) if r['is_toxic']]
+                return
+            if res['is_toxic']:
+                print(f"🚨 MATCH: {text[:40]}... [{res['reason']}]")
+                yield item, text, res
+
+    def record(self, item, text, res, image=None):
+        finding = {
+            "text": text,
+            "reason": res['reason'],
+            "link": self.url,
+            "image": image,
+            "author": item.get("author"),
+            "timestamp": item.get("timestamp"),
+            "comment_id": item.get("pk")
+        }
+        self.findings.append(finding)
+        self.unsaved.append(finding)
+        if self.on_finding:
+            self.on_finding(finding)
+        return finding
+
+    def end_pass(self, progress=None):
+        """Stores this pass's findings in one transaction and reports progress"""
+        self.scraper.findings_db.add_findings(self.unsaved)
+        self.unsaved.clear()
+        if self.on_progress and progress is not None:
+            self.on_progress(progress)
+
+    def finish(self, complete=False):
+        """Writes what is left, the scan record and the checkpoint. Returns the common run stats."""
+        complete = complete or self.reached_end
+        try:
+            self.scraper.findings_db.add_findings(self.unsaved)
+            self.unsaved.clear()
+            self.scraper.findings_db.record_scan(self.url, self.scanned, len(self.findings),
+                                                 self.newest if complete else None)
+            self.scraper.save_resume_point(self.url, self.analyzer, self.seen, self.passes, complete,
+                                           self.checkpoint, self.unrecorded, self.newest)
+        except Exception as e:
+            print(f"⚠️ Findings database error: {e}")
+        return {
+            "passes": self.passes,
+            "seconds": round(time.perf_counter() - self.started, 2),
+            "findings": len(self.findings),
+            "analyzed": self.scanned,
+            "skipped_old": self.skipped,
+            "resumed": self.checkpoint is not None,
+        }
+
 
 class EnterpriseScraper:
-    def __init__(self):
+    def __init__(self, headless=False, channel="msedge", block_resources=None,
+                 evidence_format="png", evidence_quality=80,
+                 dedup="hash", dedup_capacity=1_000_000, dedup_fp_rate=1e-4, incremental=True):
         self.base_dir = os.getcwd()
         self.evidence_dir = os.path.join(self.base_dir, "evidence")
         if not os.path.exists(self.evidence_dir):
             os.makedirs(self.evidence_dir)
 
+        self.launch_options = {
+            "headless": headless,
+            "args": ["--disable-blink-features=AutomationControlled"]
+        }
+        if channel:
+            self.launch_options["channel"] = channel
+
+        # Event-driven waits: upper bounds only, fast pages never hit them
+        self.first_comment_timeout_ms = 15000
+        self.growth_timeout_ms = 2500
+        self.stuck_limit = 6  # passes without new comments = end of thread
+        self.known_pass_limit = 2  # passes of only already-processed comments = rest of thread is known
+        self.last_run_stats = {}
+
+        # Images / media / fonts / trackers are aborted; defaults to on when headless
+        self.block_resources = headless if block_resources is None else block_resources
+        self.allowed_urls = set()  # evidence capture lets the matched node's images through
+
+        # Element clips are encoded in the browser, written by a background thread
+        # into the content-addressed store (evidence/objects + evidence/index.sqlite3)
+        self.evidence = EvidenceWriter(evidence_format, evidence_quality, store=EvidenceStore(self.evidence_dir))
+
+        # Seen comments as 64-bit hashes ("hash") or a fixed-size Bloom filter ("bloom"), see seen_set.py
+        self.dedup = dedup
+        self.dedup_capacity = dedup_capacity
+        self.dedup_fp_rate = dedup_fp_rate
+
+        # Findings and per-post checkpoints persist in evidence/findings.sqlite3; with
+        # incremental on, a re-scan skips what the last scan under the same analyzer
+        # version processed and stops scrolling once it reaches it
+        self.findings_db = FindingsDB(os.path.join(self.evidence_dir, "findings.sqlite3"))
+        self.incremental = incremental
+
+    def device_profile(self, p):
+        iphone = p.devices[DEVICE_NAME].copy()
+        iphone['viewport'] = {'width': 390, 'height': 844}
+        return iphone
+
     # ---------------------------------------------------------
     # Cookie Loader
     # ---------------------------------------------------------
-    def load_cookies(self, context):
+    def read_cookies(self):
         cookie_file = "cookies.json"
         if os.path.exists(cookie_file):
             try:
                 with open(cookie_file, 'r') as f:
                     cookies = json.load(f)
-                    for c in cookies:
-                        if 'sameSite' in c and c['sameSite'] not in ["Strict", "Lax", "None"]:
-                            c['sameSite'] = "None"
-                    context.add_cookies(cookies)
-                print("🍪 Session Cookies Injected.")
-                return True
+                for c in cookies:
+                    if 'sameSite' in c and c['sameSite'] not in ["Strict", "Lax", "None"]:
+                        c['sameSite'] = "None"
+                return cookies
             except Exception as e:
                 print("⚠️ Cookie load failed:", e)
-        return False
+        return None
+
+    def load_cookies(self, context):
+        cookies = self.read_cookies()
+        if not cookies:
+            return False
+        context.add_cookies(cookies)
+        print("🍪 Session Cookies Injected.")
+        return True
 
     # ---------------------------------------------------------
     # Text Cleaner (FIXED)
@@ -521,20 +772,196 @@ class EnterpriseScraper:
 
         return " ".join(valid_lines)
     # ---------------------------------------------------------
+    # ⏱️ EVENT-DRIVEN WAITS (instead of fixed sleeps)
+    # ---------------------------------------------------------
+    def wait_for_comments(self, page):
+        """Waits for the first comment node, then briefly for the comments XHR to settle"""
+        try:
+            page.wait_for_selector(COMMENT_SELECTOR, state="attached", timeout=self.first_comment_timeout_ms)
+        except Exception:
+            print("⚠️ No comments rendered yet, continuing anyway.")
+        try:
+            page.wait_for_load_state("networkidle", timeout=2000)
+        except Exception:
+            pass
+
+    def extract_new_comments(self, page):
+        """Comment nodes not returned before or whose text changed since, as {total, items} in a single evaluate"""
+        try:
+            return page.evaluate(EXTRACT_COMMENTS_JS, COMMENT_SELECTOR)
+        except Exception as e:
+            print(f"⚠️ Extraction error: {e}")
+            return {"total": 0, "items": []}
+
+    def wait_for_growth(self, page, previous, timeout_ms):
+        """Blocks until the comment list grows past `previous` or timeout_ms passes"""
+        try:
+            return page.evaluate(WAIT_FOR_GROWTH_JS, [COMMENT_SELECTOR, previous, timeout_ms])
+        except Exception:
+            return previous
+
+    # ---------------------------------------------------------
+    # 📡 NETWORK-FIRST BATCHING (DOM text is the fallback)
+    # ---------------------------------------------------------
+    def merge_batch(self, network_items, dom_items, seen_comments, network_live):
+        """
+        (item, text) pairs to scan this pass. Comments parsed from the app's
+        JSON responses are used as-is; rendered DOM text goes through clean_text().
+        Once the network feed is live, a DOM comment is kept only if the feed has
+        not produced it (same pk, or same text without the author line): comments
+        embedded in the initial HTML or in payloads the capture does not parse.
+        dom_items None means there is no rendered page (API backend).
+        """
+        batch = []
+        for item in network_items:
+            text = " ".join(item["text"].split())
+            if text:
+                batch.append((item, text))
+                if dom_items is not None:
+                    seen_comments.add(seen_key(None, text))  # so its rendered copy is recognised
+
+        for item in dom_items or ():
+            text = self.clean_text(item["text"])
+            if not text:
+                continue
+            # An expanded comment keeps its pk: key it by the full text so it is read again
+            pk = None if item.get("grown") else item.get("pk")
+            if seen_comments.add(seen_key(pk, self.comment_body(item, text) if network_live else text)):
+                batch.append((item, text))
+        return batch
+
+    def comment_body(self, item, text):
+        """Cleaned DOM text without the leading author name, comparable to a network comment's text"""
+        author = item.get("author")
+        if author and text.startswith(author):
+            text = text[len(author):]
+        return " ".join(text.split())
+
+    # ---------------------------------------------------------
+    # 🚫 RESOURCE BLOCKING (headless fast mode)
+    # ---------------------------------------------------------
+    def should_block(self, request):
+        if request.url in self.allowed_urls:
+            return False
+        return request.resource_type in BLOCKED_RESOURCE_TYPES or any(t in request.url for t in TRACKER_HINTS)
+
+    def route_request(self, route):
+        if self.should_block(route.request):
+            route.abort()
+        else:
+            route.continue_()
+
+    # ---------------------------------------------------------
+    # 📸 EVIDENCE
+    # ---------------------------------------------------------
+    def capture_evidence(self, page, item, text, stem, post_url=None):
+        """
+        Clip of just the highlighted comment, queued for the evidence writer.
+        Returns the file path, or None if the comment is not on the page.
+        A comment with evidence on record from any earlier scan is not re-captured.
+        """
+        key = comment_key(item.get("pk"), text, post_url)
+        cached = self.evidence.lookup(key)
+        if cached:
+            return cached
+        try:
+            el = self.locate_comment(page, item, text)
+
+            if self.block_resources:
+                # Only this node's images (avatar, stickers) are let through, then blocked again
+                self.allowed_urls.update(el.evaluate(NODE_IMAGE_URLS_JS, timeout=3000))
+                el.evaluate(RELOAD_NODE_IMAGES_JS, 2000)
+
+            # Highlight lives in a screenshot-only stylesheet, nothing to undo afterwards
+            el.evaluate("node => node.setAttribute('data-ig-hit', '')", timeout=3000)
+            data = el.screenshot(style=HIGHLIGHT_CSS, timeout=5000, **self.evidence.screenshot_options())
+            return self.evidence.submit(self.evidence.path_for(stem), data, key=key, post_url=post_url)
+        except Exception:
+            # Network-only comment not rendered (yet): keep the finding
+            return None
+        finally:
+            self.allowed_urls.clear()
+
+    def new_seen_set(self):
+        return make_seen_set(self.dedup, self.dedup_capacity, self.dedup_fp_rate)
+
+    # ---------------------------------------------------------
+    # ⏩ CHECKPOINTS (incremental re-scans)
+    # ---------------------------------------------------------
+    def resume_point(self, url, analyzer):
+        """
+        (seen set, since, checkpoint) to scan url with. If the post's checkpoint was
+        made under the same analyzer version, its seen set and the timestamp cut-off
+        of the last complete scan under that version carry over; otherwise
+        everything is analyzed again.
+        """
+        checkpoint = self.findings_db.checkpoint(url) if self.incremental else None
+        if checkpoint is not None and checkpoint["version"] != analyzer.version():
+            print("🔁 Lexicon or model changed since the last scan, re-analyzing the whole post.")
+            checkpoint = None
+        if checkpoint is None:
+            return self.new_seen_set(), None, None
+
+        seen = load_seen_set(checkpoint["seen"])
+        print(f"⏩ Resuming: {len(seen)} comments already processed, last scan went {checkpoint['depth']} passes deep.")
+        return seen, checkpoint["since"], checkpoint
+
+    def save_resume_point(self, url, analyzer, seen, depth, complete, checkpoint=None, unrecorded=(), newest=None):
+        """
+        Stores the checkpoint. `unrecorded` are hits left over when the limit was
+        reached: they are taken back out of the seen set so the next scan records them.
+        A Bloom filter can't forget, so then the previous checkpoint is kept instead.
+        The timestamp cut-off only moves to `newest` when this scan reached the end
+        of the thread; `checkpoint` is None after a version change, which drops it.
+        """
+        since = checkpoint["since"] if checkpoint is not None else None
+        if complete and newest is not None:
+            since = newest if since is None else max(since, newest)
+        if unrecorded:
+            if not isinstance(seen, SeenHashes):
+                return
+            for item, text in unrecorded:
+                seen.discard(seen_key(item.get("pk"), text))
+        if checkpoint is not None:
+            # A thread finished once stays finished: anything new is not in `seen` and still gets scanned
+            depth = max(depth, checkpoint["depth"])
+            complete = complete or checkpoint["complete"]
+        self.findings_db.save_checkpoint(url, analyzer.version(), seen.to_bytes(), depth, complete, since)
+
+    def may_stop_early(self, checkpoint, depth):
+        """Known territory ends a scan if the last one finished the thread, or once we are deeper than it got"""
+        return checkpoint is not None and (checkpoint["complete"] or depth > checkpoint["depth"])
+
+    def split_new(self, batch, since):
+        """(new pairs, newest comment time in batch): drops comments at or before `since`; undated ones stay"""
+        fresh, newest = [], None
+        for item, text in batch:
+            at = comment_epoch(item.get("timestamp"))
+            if at is not None:
+                newest = at if newest is None else max(newest, at)
+            if since is None or at is None or at > since:
+                fresh.append((item, text))
+        return fresh, newest
+
+    def locate_comment(self, page, item, text):
+        """Locator for a comment: by the tag extraction gave it, else by its text"""
+        if item.get("id"):
+            return page.locator(f"[data-ig-seen='{item['id']}']")
+        return page.locator(COMMENT_SELECTOR).filter(has_text=text[:80]).first
+
+    # ---------------------------------------------------------
     # 🔥 CONTINUOUS PAGE DOWN SCROLL
     # ---------------------------------------------------------
     def perform_continuous_scroll(self, page, presses=4):
         """
-        Human-like continuous PageDown scrolling
+        PageDown scrolling. Lazy loading is awaited by the caller (wait_for_growth).
         """
         try:
             # Ensure page focus
             page.mouse.click(200, 200)
-            time.sleep(0.2)
 
             for _ in range(presses):
                 page.keyboard.press("PageDown")
-                time.sleep(0.4)  # smooth & allows lazy loading
 
             return True
         except Exception as e:
@@ -550,8 +977,9 @@ class EnterpriseScraper:
             hidden_btns = page.locator("text='View hidden comments'").all()
             for btn in hidden_btns:
                 if btn.is_visible():
+                    before = page.locator(COMMENT_SELECTOR).count()
                     btn.click()
-                    time.sleep(1)
+                    self.wait_for_growth(page, before, 1000)
 
             # View replies
             reply_btns = page.locator(
@@ -564,8 +992,9 @@ class EnterpriseScraper:
                 if btn.is_visible():
                     try:
                         btn.scroll_into_view_if_needed()
+                        before = page.locator(COMMENT_SELECTOR).count()
                         btn.click()
-                        time.sleep(0.5)
+                        self.wait_for_growth(page, before, 500)
                     except:
                         pass
 
@@ -584,129 +1013,118 @@ class EnterpriseScraper:
     # ---------------------------------------------------------
     # MAIN RUN
     # ---------------------------------------------------------
-    def run(self, url, max_limit, analyzer):
-        findings = []
-        count = 0
-        seen_comments = set()
-        session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+    def run(self, url, max_limit, analyzer, **hooks):
+        """One-shot scan in a fresh browser. browser_pool.BrowserPool reuses one across scans."""
+        # Imported here so the dashboard renders before playwright loads
+        from playwright.sync_api import sync_playwright
 
         with sync_playwright() as p:
             print("🚀 Launching Scraper...")
 
-            iphone = p.devices['iPhone 13 Pro'].copy()
-            iphone['viewport'] = {'width': 390, 'height': 844}
-
-            browser = p.chromium.launch(
-                headless=False,
-                channel="msedge",
-                args=["--disable-blink-features=AutomationControlled"]
-            )
+            browser = p.chromium.launch(**self.launch_options)
 
-            context = browser.new_context(**iphone)
+            context = browser.new_context(**self.device_profile(p))
             self.load_cookies(context)
             page = context.new_page()
 
             try:
-                print(f"🌍 Opening: {url}")
-                page.goto(url, timeout=60000)
-                time.sleep(6)
-
-                stuck_counter = 0
-                last_count = 0
-
-                while count < max_limit:
-                    if page.is_closed():
-                        break
-
-                    # 🔥 Smooth scrolling
-                    self.perform_continuous_scroll(page, presses=4)
-
-                    # Expand replies / hidden
-                    self.expand_threads(page)
-                    time.sleep(0.8)
-
-                    comment_elements = page.locator(
-                        "ul > li, div[role='button']"
-                    ).all()
+                return self.scan_page(page, url, max_limit, analyzer, **hooks)
+            finally:
+                try:
+                    browser.close()
+                except:
+                    pass
 
-                    if len(comment_elements) == last_count:
-                        stuck_counter += 1
-                        if stuck_counter > 15:
-                            print("✅ End of comments detected.")
-                            break
-                    else:
-                        stuck_counter = 0
+    def scan_page(self, page, url, max_limit, analyzer, on_finding=None, on_progress=None):
+        """
+        Scans one post in an already open page and returns its findings.
+        on_finding(finding) fires per finding, on_progress(dict) after every pass.
+        """
+        scan = PostScan(self, url, max_limit, analyzer, on_finding, on_progress)
+        session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
+        capture = CommentCapture(scan.seen)
+        known_mark = 0
+        complete = False
 
-                    last_count = len(comment_elements)
+        capture.attach(page)  # before goto, so the first comments page is seen too
+        if self.block_resources:
+            # Page-level route: pooled contexts are shared, handlers must not pile up on them
+            page.route("**/*", self.route_request)
 
-                    batch = (
-                        comment_elements[-30:]
-                        if len(comment_elements) > 30
-                        else comment_elements
-                    )
+        first_comment_s = None
 
-                    for el in batch:
-                        if count >= max_limit:
-                            break
-                        try:
-                            raw_text = el.inner_text()
-                            text = self.clean_text(raw_text)
-                            if not text:
-                                continue
-                            if text in seen_comments:
-                                continue
+        try:
+            print(f"🌍 Opening: {url}")
+            page.goto(url, timeout=60000)
+            self.wait_for_comments(page)
+            first_comment_s = round(time.perf_counter() - scan.started, 2)
 
-                            seen_comments.add(text)
+            stuck_counter = 0
+            last_count = 0
 
-                            res = analyzer.scan(text)
-                            if res['is_toxic']:
-                                print(f"🚨 MATCH: {text[:40]}... [{res['reason']}]")
+            while not scan.full:
+                if page.is_closed():
+                    break
+                scan.passes += 1
 
-                                el.scroll_into_view_if_needed()
+                # 🔥 Scroll, then wait until new comments land (not a fixed sleep)
+                self.perform_continuous_scroll(page, presses=4)
 
-                                el.evaluate("""
-                                    node => {
-                                        node.style.border = '3px solid red';
-                                        node.style.backgroundColor = 'rgba(255,0,0,0.1)';
-                                    }
-                                """)
+                # Expand replies / hidden
+                self.expand_threads(page)
+                self.wait_for_growth(page, last_count, self.growth_timeout_ms)
 
-                                img_path = os.path.join(
-                                    self.evidence_dir,
-                                    f"evidence_{session_id}_{count}.png"
-                                )
+                # One evaluate returns only the comments we have not read yet
+                extracted = self.extract_new_comments(page)
+                network_items = capture.drain()
 
-                                page.screenshot(path=img_path)
+                if extracted["total"] == last_count and not network_items:
+                    stuck_counter += 1
+                    if stuck_counter >= self.stuck_limit:
+                        print("✅ End of comments detected.")
+                        complete = True
+                        break
+                else:
+                    stuck_counter = 0
 
-                                el.evaluate("""
-                                    node => {
-                                        node.style.border = '';
-                                        node.style.backgroundColor = '';
-                                    }
-                                """)
+                last_count = extracted["total"]
 
-                                findings.append({
-                                    "text": text,
-                                    "reason": res['reason'],
-                                    "link": url,
-                                    "image": img_path
-                                })
+                network_live = capture.comments_seen + capture.comments_known > 0
+                batch = scan.take(network_items, extracted["items"], network_live)
 
-                                count += 1
+                # Comments arrived but the last scan had processed all of them: known territory
+                arrived = bool(extracted["items"]) or capture.comments_known > known_mark
+                known_mark = capture.comments_known
+                if scan.reached_known(arrived, batch, self.known_pass_limit):
+                    break
 
-                        except:
-                            continue
+                for item, text, res in scan.hits(batch):
+                    try:
+                        img_path = self.capture_evidence(page, item, text, os.path.join(
+                            self.evidence_dir,
+                            f"evidence_{session_id}_{len(scan.findings)}"
+                        ), post_url=url)
+                        scan.record(item, text, res, img_path)
+                    except:
+                        continue
 
-            except Exception as e:
-                print(f"⚠️ Fatal error: {e}")
+                scan.end_pass({"passes": scan.passes, "comments": scan.scanned, "findings": len(scan.findings)})
 
-            finally:
-                try:
-                    browser.close()
-                except:
-                    pass
+        except Exception as e:
+            print(f"⚠️ Fatal error: {e}")
+
+        finally:
+            self.evidence.close()  # every returned image path exists on disk; no writer thread outlives the scan
+            self.last_run_stats = dict(
+                scan.finish(complete),
+                first_comment_s=first_comment_s,
+                network_comments=capture.comments_seen,
+                dom_comments=scan.dom_comments,
+                known_comments=capture.comments_known,
+                evidence_bytes=self.evidence.stats["bytes"]
+            )
 
-        return findings
+        return scan.findings
 
 
 
@@ -0,0 +1,184 @@
+#  ___________________________________________________________________________
+# |                                                                           |
+# |  PROJECT: InstaGuard Enterprise (Dedup Module)                            |
+# |  AUTHOR:  Pronoy Das                                                      |
+# |  LICENSE: MIT (Copyright © 2026 Pronoy Das)                               |
+# |___________________________________________________________________________|
+
+import hashlib
+import math
+import struct
+from array import array
+
+KINDS = ("hash", "bloom")
+
+
+def hash64(key):
+    """64-bit fingerprint of a comment key (never 0, which marks an empty slot)"""
+    digest = hashlib.blake2b(key.encode("utf-8"), digest_size=8).digest()
+    return int.from_bytes(digest, "little") or 1
+
+
+def seen_key(pk=None, text=None):
+    """Comment id when the page or API gave one, else the cleaned text"""
+    return f"pk:{pk}" if pk else f"t:{text}"
+
+
+class SeenHashes:
+    """
+    Exact-ish seen set: 8 bytes per slot in an open-addressing array at
+    load <= 0.5, so 16-32 bytes per comment instead of the whole string.
+    Two different comments collide with probability ~n^2 / 2^65.
+    """
+
+    def __init__(self, capacity=1024):
+        size = 1 << max(4, (capacity * 2 - 1).bit_length())
+        self._slots = array("Q", bytes(8 * size))
+        self._mask = size - 1
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def _find(self, slots, mask, h):
+        i = h & mask
+        while True:
+            v = slots[i]
+            if v == 0 or v == h:
+                return i
+            i = (i + 1) & mask
+
+    def _grow(self):
+        old = self._slots
+        self._slots = array("Q", bytes(16 * len(old)))
+        self._mask = len(self._slots) - 1
+        for h in old:
+            if h:
+                self._slots[self._find(self._slots, self._mask, h)] = h
+
+    def __contains__(self, key):
+        h = hash64(key)
+        return self._slots[self._find(self._slots, self._mask, h)] == h
+
+    def add(self, key):
+        """Marks key as seen. Returns True if it was new."""
+        h = hash64(key)
+        i = self._find(self._slots, self._mask, h)
+        if self._slots[i] == h:
+            return False
+        self._slots[i] = h
+        self._len += 1
+        if self._len * 2 > len(self._slots):
+            self._grow()
+        return True
+
+    def discard(self, key):
+        """Forgets key. Backward-shift deletion: later entries of the probe run move up, no tombstones."""
+        h = hash64(key)
+        slots, mask = self._slots, self._mask
+        hole = self._find(slots, mask, h)
+        if slots[hole] != h:
+            return False
+        j = hole
+        while True:
+            j = (j + 1) & mask
+            v = slots[j]
+            if v == 0:
+                break
+            # v may fill the hole unless its home slot lies cyclically in (hole, j]
+            if (j - (v & mask)) & mask >= (j - hole) & mask:
+                slots[hole] = v
+                hole = j
+        slots[hole] = 0
+        self._len -= 1
+        return True
+
+    @property
+    def nbytes(self):
+        return self._slots.itemsize * len(self._slots)
+
+    def to_bytes(self):
+        return b"H" + struct.pack("<Q", self._len) + self._slots.tobytes()
+
+    @classmethod
+    def from_bytes(cls, data):
+        seen = cls.__new__(cls)
+        (seen._len,) = struct.unpack_from("<Q", data, 1)
+        seen._slots = array("Q")
+        seen._slots.frombytes(data[9:])
+        seen._mask = len(seen._slots) - 1
+        return seen
+
+
+class SeenBloom:
+    """
+    Fixed-size Bloom filter: memory is set by capacity and fp_rate and never grows.
+    A false positive means a new comment is treated as seen and skipped, so keep
+    fp_rate small; past `capacity` comments the real rate climbs above it.
+    """
+
+    def __init__(self, capacity=1_000_000, fp_rate=1e-4):
+        self.capacity = capacity
+        self.fp_rate = fp_rate
+        self._m = max(64, math.ceil(-capacity * math.log(fp_rate) / math.log(2) ** 2))
+        self._k = max(1, round(self._m / capacity * math.log(2)))
+        self._bits = bytearray((self._m + 7) // 8)
+        self._len = 0
+
+    def __len__(self):
+        return self._len
+
+    def _positions(self, key):
+        # Kirsch-Mitzenmacher: k positions from the two halves of one 64-bit hash
+        h = hash64(key)
+        h1, h2 = h & 0xFFFFFFFF, (h >> 32) | 1
+        m = self._m
+        return [(h1 + i * h2) % m for i in range(self._k)]
+
+    def __contains__(self, key):
+        bits = self._bits
+        return all(bits[p >> 3] & (1 << (p & 7)) for p in self._positions(key))
+
+    def add(self, key):
+        """Marks key as seen. Returns True if it was (probably) new."""
+        bits = self._bits
+        new = False
+        for p in self._positions(key):
+            byte, bit = p >> 3, 1 << (p & 7)
+            if not bits[byte] & bit:
+                bits[byte] |= bit
+                new = True
+        if new:
+            self._len += 1
+        return new
+
+    @property
+    def nbytes(self):
+        return len(self._bits)
+
+    def to_bytes(self):
+        return b"B" + struct.pack("<dQQQQ", self.fp_rate, self.capacity, self._m, self._k, self._len) + self._bits
+
+    @classmethod
+    def from_bytes(cls, data):
+        seen = cls.__new__(cls)
+        seen.fp_rate, seen.capacity, seen._m, seen._k, seen._len = struct.unpack_from("<dQQQQ", data, 1)
+        seen._bits = bytearray(data[41:])
+        return seen
+
+
+def make_seen_set(kind="hash", capacity=1_000_000, fp_rate=1e-4):
+    if kind == "hash":
+        return SeenHashes()
+    if kind == "bloom":
+        return SeenBloom(capacity, fp_rate)
+    raise ValueError(f"❌ Unknown seen-set kind '{kind}', expected one of {KINDS}")
+
+
+def load_seen_set(data):
+    """Inverse of SeenHashes.to_bytes() / SeenBloom.to_bytes(), e.g. for a scan checkpoint"""
+    if data[:1] == b"H":
+        return SeenHashes.from_bytes(data)
+    if data[:1] == b"B":
+        return SeenBloom.from_bytes(data)
+    raise ValueError("❌ Not a serialized seen set")
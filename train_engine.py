@@ -55,12 +55,16 @@ def train():
     train_ds.set_format("torch")
     val_ds.set_format("torch")
 
+    use_cuda = torch.cuda.is_available()
     model = DistilBertForSequenceClassification.from_pretrained(
         MODEL_NAME,
         num_labels=2
-    ).to("cuda")
+    ).to("cuda" if use_cuda else "cpu")
 
-    print(f"⚡ Using GPU: {torch.cuda.get_device_name(0)}")
+    if use_cuda:
+        print(f"⚡ Using GPU: {torch.cuda.get_device_name(0)}")
+    else:
+        print("🐢 No CUDA device found, training on CPU")
 
     args = TrainingArguments(
         output_dir="./checkpoints",
@@ -69,7 +73,7 @@ def train():
         per_device_eval_batch_size=32,
         num_train_epochs=3,
         weight_decay=0.01,
-        fp16=True,
+        fp16=use_cuda,
         logging_steps=50,
         save_strategy="no",
         report_to="none"
@@ -95,6 +99,7 @@ def train():
     tokenizer.save_pretrained(OUTPUT_DIR)
 
     print("✅ ENGINE READY")
+    print("💡 CPU boxes: python -m instaguard export-model --verify")
 
 if __name__ == "__main__":
     train()